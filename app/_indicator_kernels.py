@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+"""Low-level numerical kernels backing the indicator calculators.
+
+The hot loops are compiled with numba when the package is installed;
+otherwise an equivalent vectorized NumPy implementation is used. Callers
+are expected to have grouped prices into unique bins (``np.unique`` +
+``np.bincount``) before invoking the kernel.
+"""
+
+import logging
+from typing import Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["volume_profile_kernel", "HAS_NUMBA"]
+
+try:  # pragma: no cover - optional dependency, exercised in production only
+    from numba import njit
+
+    HAS_NUMBA = True
+except Exception:  # pragma: no cover - numba is optional
+    njit = None
+    HAS_NUMBA = False
+    logger.debug("numba unavailable; indicator kernels fall back to NumPy")
+
+
+def _volume_profile_numpy(
+    unique_prices: np.ndarray,
+    bin_volumes: np.ndarray,
+    order: np.ndarray,
+    value_area_fraction: float,
+) -> Tuple[float, float, float, float, float, np.ndarray, np.ndarray]:
+    size = bin_volumes.size
+    total_volume = float(bin_volumes.sum())
+    weighted_price = float((unique_prices * bin_volumes).sum())
+    max_volume = float(bin_volumes.max())
+    poc = float(unique_prices[int(np.argmax(bin_volumes))])
+
+    cumulative = np.cumsum(bin_volumes[order])
+    target_volume = total_volume * value_area_fraction
+    if total_volume == 0:
+        count = 1
+    else:
+        count = min(int(np.searchsorted(cumulative, target_volume, side="left")) + 1, size)
+    value_area_prices = unique_prices[order[:count]]
+    accumulated = float(cumulative[count - 1])
+    vah = float(value_area_prices.max())
+    val = float(value_area_prices.min())
+    value_area_volume_pct = (accumulated / total_volume) if total_volume > 0 else 0.0
+
+    low_mask = np.zeros(size, dtype=np.bool_)
+    high_mask = np.zeros(size, dtype=np.bool_)
+    if max_volume > 0:
+        below_left = np.ones(size, dtype=np.bool_)
+        below_left[1:] = bin_volumes[1:] < bin_volumes[:-1]
+        below_right = np.ones(size, dtype=np.bool_)
+        below_right[:-1] = bin_volumes[:-1] < bin_volumes[1:]
+        low_mask = (bin_volumes <= max_volume * 0.35) & below_left & below_right
+        high_mask = bin_volumes >= max_volume * 0.9
+
+    vwap = (weighted_price / total_volume) if total_volume > 0 else 0.0
+    return vah, val, poc, vwap, value_area_volume_pct, low_mask, high_mask
+
+
+if HAS_NUMBA:
+
+    @njit(cache=True)  # pragma: no cover - compiled path mirrors the NumPy version
+    def _volume_profile_jit(
+        unique_prices: np.ndarray,
+        bin_volumes: np.ndarray,
+        order: np.ndarray,
+        value_area_fraction: float,
+    ) -> Tuple[float, float, float, float, float, np.ndarray, np.ndarray]:
+        size = bin_volumes.size
+        total_volume = 0.0
+        weighted_price = 0.0
+        max_volume = 0.0
+        poc = unique_prices[0]
+        for idx in range(size):
+            volume = bin_volumes[idx]
+            total_volume += volume
+            weighted_price += unique_prices[idx] * volume
+            if volume > max_volume:
+                max_volume = volume
+                poc = unique_prices[idx]
+
+        target_volume = total_volume * value_area_fraction
+        accumulated = 0.0
+        vah = unique_prices[order[0]]
+        val = vah
+        count = 0
+        for idx in range(size):
+            price = unique_prices[order[idx]]
+            accumulated += bin_volumes[order[idx]]
+            if price > vah:
+                vah = price
+            if price < val:
+                val = price
+            count += 1
+            if total_volume == 0 or accumulated >= target_volume:
+                break
+        value_area_volume_pct = (accumulated / total_volume) if total_volume > 0 else 0.0
+
+        low_mask = np.zeros(size, dtype=np.bool_)
+        high_mask = np.zeros(size, dtype=np.bool_)
+        if max_volume > 0:
+            low_cutoff = max_volume * 0.35
+            high_cutoff = max_volume * 0.9
+            for idx in range(size):
+                volume = bin_volumes[idx]
+                if volume >= high_cutoff:
+                    high_mask[idx] = True
+                if volume <= low_cutoff:
+                    below_left = idx == 0 or volume < bin_volumes[idx - 1]
+                    below_right = idx == size - 1 or volume < bin_volumes[idx + 1]
+                    if below_left and below_right:
+                        low_mask[idx] = True
+
+        vwap = (weighted_price / total_volume) if total_volume > 0 else 0.0
+        return vah, val, poc, vwap, value_area_volume_pct, low_mask, high_mask
+
+
+def volume_profile_kernel(
+    unique_prices: np.ndarray,
+    bin_volumes: np.ndarray,
+    order: np.ndarray,
+    value_area_fraction: float,
+) -> Tuple[float, float, float, float, float, np.ndarray, np.ndarray]:
+    """Compute value area, POC, VWAP and LVN/HVN masks for grouped bins.
+
+    ``unique_prices`` must be ascending, ``bin_volumes`` the matching volume
+    per price, and ``order`` the bin indices in value-area walk order
+    (descending volume, descending price on ties).
+    """
+
+    if HAS_NUMBA:
+        return _volume_profile_jit(unique_prices, bin_volumes, order, value_area_fraction)
+    return _volume_profile_numpy(unique_prices, bin_volumes, order, value_area_fraction)
@@ -7,7 +7,7 @@ from datetime import datetime, timedelta, timezone
 from io import StringIO
 from pathlib import Path
 from statistics import mean
-from typing import Iterable, List, Optional, Sequence
+from typing import Iterable, Iterator, List, Optional, Sequence
 
 from .config import Settings
 from .data_source import FileMetricsRepository
@@ -24,6 +24,9 @@ _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_WINDOWS: Sequence[int] = (30, 60, 90)
 
+# Target chunk size for streamed CSV exports.
+_CSV_CHUNK_SIZE = 8192
+
 
 def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
@@ -92,8 +95,20 @@ class BacktestRunner:
         return report
 
     def to_csv(self, report: BacktestReport) -> str:
+        return b"".join(self.iter_csv(report)).decode("utf-8")
+
+    def iter_csv(self, report: BacktestReport) -> Iterator[bytes]:
+        """Yield the CSV export in ~8 KB chunks so responses can stream it."""
+
         buffer = StringIO()
         writer = csv.writer(buffer)
+
+        def flush() -> bytes:
+            chunk = buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+            return chunk
+
         writer.writerow(
             [
                 "window_days",
@@ -114,6 +129,7 @@ class BacktestRunner:
                 "sufficient_sample",
             ]
         )
+        yield flush()
 
         for window in report.windows:
             writer.writerow(
@@ -136,6 +152,10 @@ class BacktestRunner:
                     window.sufficient_sample,
                 ]
             )
+            # Emit once enough rows have accumulated; per-row yields would
+            # fragment the response while one giant buffer defeats streaming.
+            if buffer.tell() >= _CSV_CHUNK_SIZE:
+                yield flush()
 
         writer.writerow([])
         writer.writerow(
@@ -168,8 +188,7 @@ class BacktestRunner:
                 summary.sufficient_sample,
             ]
         )
-
-        return buffer.getvalue()
+        yield flush()
 
     def _resolve_parameters(
         self,
@@ -51,6 +51,7 @@ class Settings:
     redis_url: Optional[str] = None
     indicator_cache_ttl_seconds: int = 30
     timescale_dsn: Optional[str] = None
+    signal_stream_event_delay_seconds: float = 0.5
 
     @property
     def snapshot_exists(self) -> bool:
@@ -62,23 +63,23 @@ class Settings:
 
 
 def _resolve_snapshot_path() -> Path:
-    base = Path(os.getenv("METRICS_SNAPSHOT_PATH", "")).expanduser()
+    base = os.getenv("METRICS_SNAPSHOT_PATH", "")
     if base:
-        return base
+        return Path(base).expanduser()
     return Path(__file__).resolve().parent / "data" / "sample_metrics.json"
 
 
 def _resolve_indicator_snapshot_path() -> Path:
-    base = Path(os.getenv("INDICATOR_SNAPSHOT_PATH", "")).expanduser()
+    base = os.getenv("INDICATOR_SNAPSHOT_PATH", "")
     if base:
-        return base
+        return Path(base).expanduser()
     return Path(__file__).resolve().parent / "data" / "sample_indicator_data.json"
 
 
 def _resolve_backtest_log_path() -> Path:
-    base = Path(os.getenv("BACKTEST_LOG_PATH", "")).expanduser()
+    base = os.getenv("BACKTEST_LOG_PATH", "")
     if base:
-        return base
+        return Path(base).expanduser()
     return Path(__file__).resolve().parent / "data" / "backtest_logs"
 
 
@@ -205,4 +206,8 @@ def get_settings() -> Settings:
             _resolve_int(os.getenv("INDICATOR_CACHE_TTL_SECONDS"), 30),
         ),
         timescale_dsn=os.getenv("TIMESCALE_DSN"),
+        signal_stream_event_delay_seconds=max(
+            0.0,
+            _resolve_threshold(os.getenv("SIGNAL_STREAM_EVENT_DELAY_SECONDS"), 0.5),
+        ),
     )
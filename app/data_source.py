@@ -3,11 +3,32 @@ from __future__ import annotations
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from threading import Lock
+from typing import Optional, Tuple
+
+try:  # pragma: no cover - optional dependency, exercised in production only
+    import msgspec
+except Exception:  # pragma: no cover - msgspec is optional
+    msgspec = None
+
+try:  # pragma: no cover - optional dependency, exercised in production only
+    import orjson
+except Exception:  # pragma: no cover - orjson is optional
+    orjson = None
 
 from .models import MetricsSnapshot
 
 
+def _decode_json(raw: bytes) -> dict:
+    """Decode snapshot bytes with the fastest available JSON parser."""
+
+    if msgspec is not None:
+        return msgspec.json.decode(raw)
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 class MetricsRepositoryError(RuntimeError):
     """Raised when the metrics snapshot cannot be loaded."""
 
@@ -25,17 +46,37 @@ class FileMetricsRepository:
 
     def __init__(self, snapshot_path: Path) -> None:
         self._snapshot_path = snapshot_path
+        # Parsed snapshot keyed by file mtime, mirroring the market data
+        # cache: endpoints hitting the repository back to back reuse the
+        # validated model until the file changes on disk.
+        self._cached: Optional[Tuple[int, MetricsSnapshot]] = None
+        self._cache_lock = Lock()
 
     def fetch_snapshot(self) -> MetricsSnapshot:
-        if not self._snapshot_path.exists():
+        try:
+            mtime = self._snapshot_path.stat().st_mtime_ns
+        except OSError as exc:
             raise MetricsRepositoryError(
                 f"Metrics snapshot not found at {self._snapshot_path}"
-            )
+            ) from exc
+
+        cached = self._cached
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        with self._cache_lock:
+            cached = self._cached
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+            snapshot = self._load_snapshot()
+            self._cached = (mtime, snapshot)
+            return snapshot
 
+    def _load_snapshot(self) -> MetricsSnapshot:
         try:
-            with self._snapshot_path.open("r", encoding="utf-8") as handle:
-                payload = json.load(handle)
-        except json.JSONDecodeError as exc:
+            payload = _decode_json(self._snapshot_path.read_bytes())
+        except ValueError as exc:
+            # Covers stdlib json, orjson, and msgspec decode errors.
             raise MetricsRepositoryError("Invalid metrics snapshot JSON") from exc
 
         # Coerce ISO strings into datetime before validation for better error messaging
@@ -3,13 +3,25 @@ from __future__ import annotations
 """Services for computing higher-level indicator aggregates from market data."""
 
 import json
+import os
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from statistics import fmean, pstdev
 from typing import Dict, List, Mapping, MutableMapping, Optional, Sequence, Tuple
 
+import numpy as np
+
+try:  # pragma: no cover - optional dependency, exercised in production only
+    import polars as pl
+
+    HAS_POLARS = True
+except Exception:  # pragma: no cover - polars is optional
+    pl = None
+    HAS_POLARS = False
+
+from ._indicator_kernels import volume_profile_kernel
 from .indicator_models import (
     CvdCurveResponse,
     DeltaOiCurveResponse,
@@ -18,7 +30,7 @@ from .indicator_models import (
     VolumeProfileDistributionBin,
     VolumeProfileStatsResponse,
 )
-from .sessions import determine_session
+from .sessions import determine_session, determine_sessions
 
 __all__ = [
     "Trade",
@@ -33,6 +45,18 @@ __all__ = [
 ]
 
 
+_SIDE_SIGN: Dict[str, float] = {
+    "buy": 1.0,
+    "bid": 1.0,
+    "buyer": 1.0,
+    "long": 1.0,
+    "sell": -1.0,
+    "ask": -1.0,
+    "seller": -1.0,
+    "short": -1.0,
+}
+
+
 @dataclass(frozen=True)
 class Trade:
     """Individual trade print required for cumulative volume delta."""
@@ -46,12 +70,10 @@ class Trade:
         """Return the signed quantity contribution for the trade."""
 
         quantity = float(self.quantity)
-        side = (self.side or "").strip().lower()
-        if side in {"buy", "bid", "buyer", "long"}:
-            return abs(quantity)
-        if side in {"sell", "ask", "seller", "short"}:
-            return -abs(quantity)
-        return quantity
+        sign = _SIDE_SIGN.get(self.side.strip().lower() if self.side else "")
+        if sign is None:
+            return quantity
+        return sign * abs(quantity)
 
 
 @dataclass(frozen=True)
@@ -100,13 +122,76 @@ class VolumeProfileComputation:
     generated_at: datetime
 
 
-def _floor_to_timeframe(timestamp: datetime, minutes: int) -> datetime:
-    minutes = max(int(minutes), 1)
-    floored = timestamp.replace(second=0, microsecond=0)
-    remainder = floored.minute % minutes
-    if remainder:
-        floored -= timedelta(minutes=remainder)
-    return floored
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_NS_PER_MINUTE = 60 * 1_000_000_000
+
+
+def _to_epoch_ns(timestamp: datetime) -> int:
+    """Convert a (naive-UTC or aware) datetime to integer epoch nanoseconds."""
+
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    delta = timestamp - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1_000
+
+
+def _from_epoch_ns(ts_ns: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=ts_ns // 1_000)
+
+
+def _floor_ns(ts_ns: int, bucket_ns: int) -> int:
+    return (ts_ns // bucket_ns) * bucket_ns
+
+
+def _floor_ns_array(arr: np.ndarray, bucket_ns: int) -> np.ndarray:
+    """Vectorized bucket flooring over an int64 epoch-nanosecond array."""
+
+    return (arr // bucket_ns) * bucket_ns
+
+
+# Trade count at which the polars group-by pipeline beats the dict-based
+# bucketing enough to amortise frame construction.
+_POLARS_TRADE_THRESHOLD = 50_000
+
+
+def _cvd_series_polars(trades: Sequence[Trade], bucket_ns: int) -> Dict[str, List[IndicatorSeriesPoint]]:
+    """Aggregate CVD curves via polars' native group-by + cumulative sum."""
+
+    times_ns: List[int] = []
+    hours: List[int] = []
+    signed_quantities: List[float] = []
+    for trade in trades:
+        signed = trade.signed_quantity()
+        if signed == 0.0:
+            continue
+        times_ns.append(_to_epoch_ns(trade.time))
+        hours.append(trade.time.hour)
+        signed_quantities.append(signed)
+
+    if not times_ns:
+        return {}
+
+    # One gather classifies the whole batch instead of a per-trade call.
+    sessions = determine_sessions(np.asarray(hours, dtype=np.int64)).tolist()
+
+    frame = pl.DataFrame(
+        {"time_ns": times_ns, "session": sessions, "signed": signed_quantities},
+        schema={"time_ns": pl.Int64, "session": pl.Utf8, "signed": pl.Float64},
+    )
+    curve = (
+        frame.with_columns(((pl.col("time_ns") // bucket_ns) * bucket_ns).alias("bucket_ns"))
+        .group_by(["session", "bucket_ns"])
+        .agg(pl.col("signed").sum())
+        .sort(["session", "bucket_ns"])
+        .with_columns(pl.col("signed").cum_sum().over("session").round(6).alias("cvd"))
+    )
+
+    series: Dict[str, List[IndicatorSeriesPoint]] = defaultdict(list)
+    for session, bucket_time_ns, _, value in curve.iter_rows():
+        series[session].append(
+            IndicatorSeriesPoint.model_construct(time=_from_epoch_ns(bucket_time_ns), value=float(value))
+        )
+    return dict(series)
 
 
 def _normalise_timeframe(value: str | int) -> Tuple[str, int]:
@@ -142,38 +227,37 @@ class CvdCalculator:
         if timeframe_minutes <= 0:
             raise ValueError("Timeframe minutes must be positive")
         self._timeframe_minutes = int(timeframe_minutes)
+        self._bucket_ns = self._timeframe_minutes * _NS_PER_MINUTE
 
     def compute(self, trades: Sequence[Trade]) -> Dict[str, List[IndicatorSeriesPoint]]:
-        buckets: Dict[str, MutableMapping[datetime, float]] = defaultdict(lambda: defaultdict(float))
+        bucket_ns = self._bucket_ns
+        buckets: Dict[str, MutableMapping[int, float]] = defaultdict(lambda: defaultdict(float))
         for trade in sorted(trades, key=lambda item: item.time):
             signed = trade.signed_quantity()
             if signed == 0.0:
                 continue
-            bucket_time = _floor_to_timeframe(trade.time, self._timeframe_minutes)
+            bucket_time = _floor_ns(_to_epoch_ns(trade.time), bucket_ns)
             session = determine_session(trade.time)
             buckets[session][bucket_time] += signed
 
         series: Dict[str, List[IndicatorSeriesPoint]] = {}
         for session, values in buckets.items():
-            cumulative = 0.0
-            points: List[IndicatorSeriesPoint] = []
-            for timestamp in sorted(values):
-                cumulative += values[timestamp]
-                points.append(IndicatorSeriesPoint(time=timestamp, value=round(cumulative, 6)))
-            if points:
-                series[session] = points
+            if not values:
+                continue
+            ordered = sorted(values)
+            bucket_sums = np.fromiter(
+                (values[bucket_time] for bucket_time in ordered),
+                dtype=np.float64,
+                count=len(ordered),
+            )
+            curve = np.round(np.cumsum(bucket_sums), 6)
+            series[session] = [
+                IndicatorSeriesPoint.model_construct(time=_from_epoch_ns(bucket_time), value=float(value))
+                for bucket_time, value in zip(ordered, curve)
+            ]
         return series
 
 
-def _find_base_sample(
-    history: Sequence[OpenInterestSample], target_time: datetime
-) -> Optional[OpenInterestSample]:
-    for sample in reversed(history):
-        if sample.time <= target_time:
-            return sample
-    return None
-
-
 class DeltaOpenInterestCalculator:
     """Computes ΔOI% time series across rolling windows."""
 
@@ -189,63 +273,105 @@ class DeltaOpenInterestCalculator:
                 seen[label] = minutes
                 ordered.append((label, minutes))
         self._windows = tuple(ordered)
+        self._window_ns = np.array(
+            [minutes * _NS_PER_MINUTE for _, minutes in ordered], dtype=np.int64
+        )
 
-    def compute(
+    def compute_raw(
+        self, samples: Sequence[OpenInterestSample]
+    ) -> Dict[str, Dict[str, Tuple[List[datetime], np.ndarray]]]:
+        """Scan samples once and return (times, deltas-array) pairs per window/session."""
+
+        raw: Dict[str, Dict[str, Tuple[List[datetime], np.ndarray]]] = {
+            label: {} for label, _ in self._windows
+        }
+        if not samples:
+            return raw
+
+        by_session: Dict[str, List[OpenInterestSample]] = defaultdict(list)
+        for sample in sorted(samples, key=lambda item: item.time):
+            by_session[determine_session(sample.time)].append(sample)
+
+        for session, session_samples in by_session.items():
+            times = [sample.time for sample in session_samples]
+            times_ns = np.array([_to_epoch_ns(time) for time in times], dtype=np.int64)
+            open_interest = np.array(
+                [sample.open_interest for sample in session_samples], dtype=np.float64
+            )
+
+            # All windows in one broadcast searchsorted pass (N x W); for each
+            # sample/window pair, base_idx is the latest sample at or before
+            # the window cutoff.
+            targets = times_ns[:, None] - self._window_ns[None, :]
+            base_idx = (
+                np.searchsorted(times_ns, targets.ravel(), side="right").reshape(targets.shape) - 1
+            )
+            valid = base_idx >= 0
+            safe_idx = np.where(valid, base_idx, 0)
+            base_oi = open_interest[safe_idx]
+            valid &= base_oi != 0
+            with np.errstate(divide="ignore", invalid="ignore"):
+                deltas = (open_interest[:, None] - base_oi) / base_oi
+
+            for column, (label, _) in enumerate(self._windows):
+                rows = np.nonzero(valid[:, column])[0]
+                if rows.size == 0:
+                    continue
+                raw[label][session] = (
+                    [times[row] for row in rows],
+                    deltas[rows, column],
+                )
+
+        return raw
+
+    def build_points(
         self,
-        samples: Sequence[OpenInterestSample],
+        raw: Mapping[str, Mapping[str, Tuple[List[datetime], np.ndarray]]],
         *,
         normalise: bool = False,
     ) -> Dict[str, Dict[str, List[IndicatorSeriesPoint]]]:
-        history_by_session: Dict[str, List[OpenInterestSample]] = defaultdict(list)
+        """Materialise response points (optionally z-scored) from a raw scan result."""
+
         results: Dict[str, Dict[str, List[IndicatorSeriesPoint]]] = {
             label: defaultdict(list) for label, _ in self._windows
         }
-        value_tracker: Dict[str, Dict[str, List[float]]] = {
-            label: defaultdict(list) for label, _ in self._windows
-        }
-
-        for sample in sorted(samples, key=lambda item: item.time):
-            session = determine_session(sample.time)
-            session_history = history_by_session[session]
-            for label, minutes in self._windows:
-                target_time = sample.time - timedelta(minutes=minutes)
-                base = _find_base_sample(session_history, target_time)
-                if base is None:
+        for label, session_map in raw.items():
+            for session, (times, values) in session_map.items():
+                if not times:
                     continue
-                if base.open_interest == 0:
-                    continue
-                delta = (sample.open_interest - base.open_interest) / base.open_interest
-                results[label][session].append(IndicatorSeriesPoint(time=sample.time, value=round(delta, 6)))
-                value_tracker[label][session].append(delta)
-            session_history.append(sample)
-
-        if normalise:
-            for label, session_map in results.items():
-                for session, points in session_map.items():
-                    raw_values = value_tracker[label][session]
-                    if not points:
-                        continue
-                    if len(raw_values) < 2:
-                        session_map[session] = [
-                            IndicatorSeriesPoint(time=points[0].time, value=0.0)
+                values = np.asarray(values, dtype=np.float64)
+                if normalise:
+                    if values.size < 2:
+                        results[label][session] = [
+                            IndicatorSeriesPoint.model_construct(time=times[0], value=0.0)
                         ]
                         continue
-                    mean = fmean(raw_values)
-                    std = pstdev(raw_values)
+                    std = float(values.std())
                     if std == 0:
-                        session_map[session] = [
-                            IndicatorSeriesPoint(time=point.time, value=0.0)
-                            for point in points
+                        results[label][session] = [
+                            IndicatorSeriesPoint.model_construct(time=time, value=0.0)
+                            for time in times
                         ]
                         continue
-                    normalised = []
-                    for point, value in zip(points, raw_values):
-                        z_score = (value - mean) / std
-                        normalised.append(IndicatorSeriesPoint(time=point.time, value=round(z_score, 6)))
-                    session_map[session] = normalised
+                    values = (values - values.mean()) / std
+                # One SIMD rounding pass per series instead of a round() builtin
+                # call per point.
+                values = np.round(values, 6)
+                results[label][session] = [
+                    IndicatorSeriesPoint.model_construct(time=time, value=float(value))
+                    for time, value in zip(times, values)
+                ]
 
         return results
 
+    def compute(
+        self,
+        samples: Sequence[OpenInterestSample],
+        *,
+        normalise: bool = False,
+    ) -> Dict[str, Dict[str, List[IndicatorSeriesPoint]]]:
+        return self.build_points(self.compute_raw(samples), normalise=normalise)
+
 
 class VolumeProfileCalculator:
     """Approximates session-based volume profiles from candle data."""
@@ -267,20 +393,13 @@ class VolumeProfileCalculator:
         return stats
 
     def _compute_session(self, candles: Sequence[Candle]) -> VolumeProfileComputation:
-        price_volume: Dict[float, float] = defaultdict(float)
-        total_volume = 0.0
-        weighted_price = 0.0
-
-        for candle in candles:
-            volume = max(float(candle.volume), 0.0)
-            price = float(round(candle.close, 2))
-            price_volume[price] += volume
-            total_volume += volume
-            weighted_price += price * volume
-
-        if not price_volume:
+        closes = np.array([candle.close for candle in candles], dtype=np.float64)
+        vols = np.clip(np.array([candle.volume for candle in candles], dtype=np.float64), 0.0, None)
+        rounded = np.round(closes, 2)
+
+        if rounded.size == 0:
             last_price = float(round(candles[-1].close, 2))
-            distribution = [VolumeProfileDistributionBin(price=last_price, volume=0.0)]
+            distribution = [VolumeProfileDistributionBin.model_construct(price=last_price, volume=0.0)]
             return VolumeProfileComputation(
                 vah=last_price,
                 val=last_price,
@@ -293,48 +412,29 @@ class VolumeProfileCalculator:
                 generated_at=candles[-1].time,
             )
 
-        sorted_prices = sorted(price_volume.items())
+        total_volume = float(vols.sum())
+
+        unique_prices, inverse = np.unique(rounded, return_inverse=True)
+        bin_volumes = np.bincount(inverse, weights=vols)
+
         distribution = [
-            VolumeProfileDistributionBin(price=price, volume=round(volume, 6))
-            for price, volume in sorted_prices
+            VolumeProfileDistributionBin.model_construct(price=float(price), volume=float(volume))
+            for price, volume in zip(unique_prices, np.round(bin_volumes, 6))
         ]
-        volumes = [volume for _, volume in sorted_prices]
-        max_volume = max(volumes)
-        poc_candidates = [price for price, volume in sorted_prices if volume == max_volume]
-        poc = min(poc_candidates)
-
-        sorted_by_volume = sorted(price_volume.items(), key=lambda item: (item[1], item[0]), reverse=True)
-        target_volume = total_volume * self._value_area_fraction
-        accumulated = 0.0
-        value_area_prices: List[float] = []
-        for price, volume in sorted_by_volume:
-            value_area_prices.append(price)
-            accumulated += volume
-            if total_volume == 0 or accumulated >= target_volume:
-                break
-        if not value_area_prices:
-            value_area_prices.append(poc)
-        vah = max(value_area_prices)
-        val = min(value_area_prices)
-        value_area_volume_pct = (accumulated / total_volume) if total_volume > 0 else 0.0
-
-        low_volume_nodes: List[float] = []
-        high_volume_nodes: List[float] = []
-        for idx, (price, volume) in enumerate(sorted_prices):
-            left = volumes[idx - 1] if idx > 0 else None
-            right = volumes[idx + 1] if idx < len(volumes) - 1 else None
-            if max_volume > 0:
-                if volume <= max_volume * 0.35 and (left is None or volume < left) and (
-                    right is None or volume < right
-                ):
-                    low_volume_nodes.append(price)
-                if volume >= max_volume * 0.9:
-                    high_volume_nodes.append(price)
-
-        low_volume_nodes = list(dict.fromkeys(low_volume_nodes))
-        high_volume_nodes = list(dict.fromkeys(high_volume_nodes))
-
-        vwap = (weighted_price / total_volume) if total_volume > 0 else float(candles[-1].close)
+
+        # Value-area walk order: descending volume, ties broken by descending
+        # price (lexsort is ascending). unique_prices is ascending, so the
+        # kernel's argmax-style scan picks the lowest price POC on ties.
+        order = np.lexsort((unique_prices, bin_volumes))[::-1]
+        vah, val, poc, vwap, value_area_volume_pct, low_mask, high_mask = volume_profile_kernel(
+            unique_prices, bin_volumes, order, self._value_area_fraction
+        )
+
+        low_volume_nodes = [float(price) for price in unique_prices[low_mask]]
+        high_volume_nodes = [float(price) for price in unique_prices[high_mask]]
+
+        if total_volume <= 0:
+            vwap = float(candles[-1].close)
 
         return VolumeProfileComputation(
             vah=round(vah, 6),
@@ -388,15 +488,38 @@ class IndicatorComputationWorker:
         self._value_area_fraction = value_area_fraction
         self._store = store
 
+    def _compute_for_symbol(
+        self, symbol: str, inputs: IndicatorInputs
+    ) -> Tuple[List[CvdCurveResponse], List[DeltaOiCurveResponse], List[VolumeProfileStatsResponse]]:
+        return (
+            self._build_cvd(symbol, inputs.trades),
+            self._build_delta(symbol, inputs.open_interest),
+            self._build_volume_profiles(symbol, inputs.candles),
+        )
+
     def compute_dataset(self) -> IndicatorDataset:
         cvd_entries: List[CvdCurveResponse] = []
         delta_entries: List[DeltaOiCurveResponse] = []
         profile_entries: List[VolumeProfileStatsResponse] = []
 
-        for symbol, inputs in self._data.items():
-            cvd_entries.extend(self._build_cvd(symbol, inputs.trades))
-            delta_entries.extend(self._build_delta(symbol, inputs.open_interest))
-            profile_entries.extend(self._build_volume_profiles(symbol, inputs.candles))
+        items = list(self._data.items())
+        if len(items) > 1:
+            # Symbols are independent, so fan the per-symbol work out across a
+            # thread pool; the NumPy (and optional numba) kernels release the
+            # GIL for the heavy array passes. executor.map preserves symbol
+            # order so output is deterministic.
+            workers = min(len(items), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                computed = list(
+                    executor.map(lambda entry: self._compute_for_symbol(entry[0], entry[1]), items)
+                )
+        else:
+            computed = [self._compute_for_symbol(symbol, inputs) for symbol, inputs in items]
+
+        for cvd_list, delta_list, profile_list in computed:
+            cvd_entries.extend(cvd_list)
+            delta_entries.extend(delta_list)
+            profile_entries.extend(profile_list)
 
         return IndicatorDataset(
             cvd=cvd_entries,
@@ -416,9 +539,13 @@ class IndicatorComputationWorker:
             return []
 
         responses: List[CvdCurveResponse] = []
+        use_polars = HAS_POLARS and len(filtered) >= _POLARS_TRADE_THRESHOLD
         for timeframe_label, minutes in self._cvd_timeframes:
-            calculator = CvdCalculator(minutes)
-            series_by_session = calculator.compute(filtered)
+            if use_polars:
+                series_by_session = _cvd_series_polars(filtered, minutes * _NS_PER_MINUTE)
+            else:
+                calculator = CvdCalculator(minutes)
+                series_by_session = calculator.compute(filtered)
             for session, points in series_by_session.items():
                 if not points:
                     continue
@@ -442,7 +569,8 @@ class IndicatorComputationWorker:
             return []
 
         calculator = DeltaOpenInterestCalculator(self._delta_windows)
-        raw_series = calculator.compute(filtered, normalise=False)
+        raw = calculator.compute_raw(filtered)
+        raw_series = calculator.build_points(raw)
         responses: List[DeltaOiCurveResponse] = []
         for timeframe_label, session_points in raw_series.items():
             for session, points in session_points.items():
@@ -459,7 +587,7 @@ class IndicatorComputationWorker:
                 )
 
         if self._include_delta_zscore:
-            normalised_series = calculator.compute(filtered, normalise=True)
+            normalised_series = calculator.build_points(raw, normalise=True)
             for timeframe_label, session_points in normalised_series.items():
                 z_label = f"{timeframe_label}_z"
                 for session, points in session_points.items():
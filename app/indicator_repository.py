@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Iterable, Optional, TypeVar
+from typing import Iterable, List, Optional, Tuple, TypeVar
 
 from .indicator_models import (
     CvdCurveResponse,
@@ -12,6 +12,11 @@ from .indicator_models import (
     VolumeProfileStatsResponse,
 )
 
+try:  # pragma: no cover - optional dependency, exercised in production only
+    import orjson
+except Exception:  # pragma: no cover - orjson is optional
+    orjson = None
+
 DEFAULT_INDICATOR_DATA_PATH = Path(__file__).resolve().parent / "data" / "sample_indicator_data.json"
 
 SeriesT = TypeVar("SeriesT", bound=IndicatorResponseBase)
@@ -36,9 +41,10 @@ class IndicatorRepository:
             raise IndicatorRepositoryError(f"Indicator snapshot not found at {self._data_path}")
 
         try:
-            with self._data_path.open("r", encoding="utf-8") as handle:
-                payload = json.load(handle)
-        except json.JSONDecodeError as exc:  # pragma: no cover - defensive guard
+            raw = self._data_path.read_bytes()
+            # orjson parses bytes directly, skipping the UTF-8 str decode.
+            payload = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except (json.JSONDecodeError, ValueError) as exc:  # pragma: no cover - defensive guard
             raise IndicatorRepositoryError("Indicator snapshot contains invalid JSON") from exc
 
         return IndicatorDataset.model_validate(payload)
@@ -84,6 +90,20 @@ class IndicatorRepository:
             f"No indicator series for symbol={symbol_key} timeframe={timeframe_key} session={session_key}"
         )
 
+    def series_pairs(self) -> List[Tuple[str, str]]:
+        """Unique (symbol, timeframe) pairs present in the snapshot, in order."""
+
+        dataset = self._load_dataset()
+        pairs: List[Tuple[str, str]] = []
+        seen = set()
+        for series in (dataset.cvd, dataset.delta_oi_pct, dataset.volume_profile):
+            for entry in series:
+                pair = (entry.symbol.upper(), entry.timeframe.lower())
+                if pair not in seen:
+                    seen.add(pair)
+                    pairs.append(pair)
+        return pairs
+
     def cvd_curve(self, *, symbol: str, timeframe: str, session: Optional[str] = None) -> CvdCurveResponse:
         dataset = self._load_dataset()
         return self._select_series(dataset.cvd, symbol=symbol, timeframe=timeframe, session=session)
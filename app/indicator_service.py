@@ -2,26 +2,119 @@ from __future__ import annotations
 
 import json
 import logging
+import random
 import time
+from collections import Counter, OrderedDict
+from concurrent.futures import Future
+from functools import lru_cache
 from threading import Lock
-from typing import Any, Optional, Type
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple, Type
 
 from pydantic import BaseModel
 
 from .indicator_models import CvdCurveResponse, DeltaOiCurveResponse, VolumeProfileStatsResponse
 from .indicator_repository import IndicatorRepository
 
+try:  # pragma: no cover - optional dependency, exercised in production only
+    import orjson
+except Exception:  # pragma: no cover - orjson is optional
+    orjson = None
+
+try:  # pragma: no cover - optional dependency, exercised in production only
+    import msgpack
+except Exception:  # pragma: no cover - msgpack is optional
+    msgpack = None
+
 logger = logging.getLogger(__name__)
 
 
+# Pre-resolved pydantic-core serializers for the cacheable response types;
+# calling to_json with no kwargs skips model_dump_json's keyword plumbing.
+_SERIALIZERS = {
+    cls: cls.__pydantic_serializer__
+    for cls in (CvdCurveResponse, DeltaOiCurveResponse, VolumeProfileStatsResponse)
+}
+
+
+def _orjson_default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.__dict__
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _dump_payload(value: BaseModel) -> bytes:
+    # msgpack skips UTF-8 escape scanning and roughly halves the bytes for
+    # the numeric series we cache, so it wins over JSON when installed.
+    if msgpack is not None:
+        return msgpack.packb(value.model_dump(mode="json"), use_bin_type=True)
+    serializer = _SERIALIZERS.get(type(value))
+    if serializer is not None:
+        return serializer.to_json(value)
+    if orjson is not None:
+        # Fully-populated DTOs with no alias/computed-field logic can skip
+        # model_dump entirely; orjson walks __dict__ (and nested models via
+        # the default hook) directly.
+        if value.model_fields_set == set(value.model_fields):
+            return orjson.dumps(value.__dict__, default=_orjson_default)
+        return orjson.dumps(value.model_dump(mode="json"))
+    # Encode here so the payload is bytes end-to-end; redis-py would
+    # otherwise re-encode the str on write and decode it again on read.
+    return value.model_dump_json().encode("utf-8")
+
+
+def _load_payload(payload: bytes) -> Any:
+    if msgpack is not None:
+        return msgpack.unpackb(payload, raw=False)
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+@lru_cache(maxsize=4096)
+def _cache_key(prefix: str, symbol: str, timeframe: str, session: Optional[str]) -> str:
+    """Build (and memoize) the cache key for an indicator request.
+
+    The set of (symbol, timeframe, session) tuples seen in production is
+    small and bounded, so the case conversions and join run once per tuple.
+    """
+
+    return ":".join([prefix, symbol.upper(), timeframe.lower(), (session or "*").lower()])
+
+
+_SHARD_COUNT = 64  # power of two so shard selection is a cheap mask
+_L1_MAX_ENTRIES = 1024  # per-process cap on constructed-model cache entries
+_STATS_MAX_KEYS = 4096  # cap on tracked access counters before trimming
+
+
 class IndicatorCache:
     """Simple TTL cache that prefers Redis but falls back to an in-memory store."""
 
-    def __init__(self, redis_url: Optional[str] = None, ttl_seconds: int = 30) -> None:
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        ttl_seconds: int = 30,
+        *,
+        validate_on_read: bool = False,
+    ) -> None:
         self._ttl = max(int(ttl_seconds), 1)
         self._redis = self._init_redis(redis_url)
-        self._store: dict[str, tuple[float, str]] = {}
-        self._lock = Lock()
+        # In-memory fallback store is sharded with per-shard locks so
+        # concurrent get/set under the server thread pool don't serialize on
+        # one global lock.
+        self._shards: list[tuple[dict[str, tuple[float, bytes]], Lock]] = [
+            ({}, Lock()) for _ in range(_SHARD_COUNT)
+        ]
+        # Cached payloads are produced by our own set(); full validation on
+        # read is only useful when debugging payload drift.
+        self._validate_on_read = validate_on_read
+        # Bounded L1 of already-constructed models in front of Redis: an L1
+        # hit skips the socket round-trip and the JSON parse entirely.
+        self._l1: OrderedDict[str, tuple[float, BaseModel]] = OrderedDict()
+        self._l1_lock = Lock()
+        # Per-key access counters feed the prewarm task and any future
+        # admission policy; purely advisory, never affects correctness.
+        self._stats: Counter[str] = Counter()
+        self._stats_lock = Lock()
 
     def _init_redis(self, redis_url: Optional[str]) -> Optional[Any]:
         if not redis_url:
@@ -34,7 +127,9 @@ class IndicatorCache:
             return None
 
         try:
-            client = redis.Redis.from_url(redis_url, decode_responses=True)
+            # Payloads may be msgpack (binary), so keep raw bytes; every
+            # decoder in _load_payload accepts bytes directly anyway.
+            client = redis.Redis.from_url(redis_url, decode_responses=False)
             client.ping()
         except Exception as exc:  # pragma: no cover - depends on runtime environment
             logger.warning("Redis ping failed (%s); using in-memory indicator cache", exc)
@@ -43,29 +138,133 @@ class IndicatorCache:
         logger.info("Using Redis-backed cache for indicator responses")
         return client
 
+    def _shard(self, key: str) -> tuple[dict[str, tuple[float, bytes]], Lock]:
+        return self._shards[hash(key) & (_SHARD_COUNT - 1)]
+
     def _now(self) -> float:
-        return time.time()
+        # Monotonic: TTL bookkeeping must not move with wall-clock jumps.
+        return time.monotonic()
+
+    def _l1_get(self, key: str, model_cls: Type[BaseModel]) -> Optional[BaseModel]:
+        now = self._now()
+        with self._l1_lock:
+            record = self._l1.get(key)
+            if record is None:
+                return None
+            expires_at, model = record
+            if expires_at <= now or not isinstance(model, model_cls):
+                del self._l1[key]
+                return None
+            self._l1.move_to_end(key)
+            return model
+
+    def _l1_set(self, key: str, model: BaseModel) -> None:
+        with self._l1_lock:
+            self._l1[key] = (self._now() + self._ttl, model)
+            self._l1.move_to_end(key)
+            while len(self._l1) > _L1_MAX_ENTRIES:
+                self._l1.popitem(last=False)
+
+    def _record_access(self, *keys: str) -> None:
+        with self._stats_lock:
+            for key in keys:
+                self._stats[key] += 1
+            if len(self._stats) > _STATS_MAX_KEYS:
+                self._stats = Counter(dict(self._stats.most_common(_STATS_MAX_KEYS // 2)))
+
+    def top_k(self, n: int) -> list[str]:
+        """Most-accessed cache keys, hottest first."""
+
+        with self._stats_lock:
+            return [key for key, _ in self._stats.most_common(n)]
 
     def get(self, key: str, model_cls: Type[BaseModel]) -> Optional[BaseModel]:
-        payload: Optional[str]
+        self._record_access(key)
+        hit = self._l1_get(key, model_cls)
+        if hit is not None:
+            return hit
+
+        payload: Optional[bytes]
         if self._redis is not None:
             payload = self._redis.get(key)
         else:
-            with self._lock:
-                record = self._store.get(key)
+            now = self._now()
+            store, lock = self._shard(key)
+            with lock:
+                record = store.get(key)
                 if not record:
                     return None
                 expires_at, payload = record
-                if expires_at <= self._now():
-                    del self._store[key]
+                if expires_at <= now:
+                    del store[key]
                     return None
 
         if not payload:
             return None
 
+        return self._decode(key, payload, model_cls)
+
+    def get_many(
+        self,
+        keys: Sequence[str],
+        model_map: Mapping[str, Type[BaseModel]],
+    ) -> Dict[str, BaseModel]:
+        """Fetch several keys in one round-trip; misses are simply absent.
+
+        With Redis this issues a single MGET instead of one GET per key, so
+        N keys cost one RTT. The in-memory fallback resolves each key from
+        its shard.
+        """
+
+        self._record_access(*keys)
+        results: Dict[str, BaseModel] = {}
+        pending: list[str] = []
+        for key in keys:
+            hit = self._l1_get(key, model_map[key])
+            if hit is not None:
+                results[key] = hit
+            else:
+                pending.append(key)
+
+        if not pending:
+            return results
+
+        if self._redis is not None:
+            payloads = self._redis.mget(pending)
+        else:
+            now = self._now()
+            payloads = []
+            for key in pending:
+                store, lock = self._shard(key)
+                with lock:
+                    record = store.get(key)
+                    if not record:
+                        payloads.append(None)
+                        continue
+                    expires_at, payload = record
+                    if expires_at <= now:
+                        del store[key]
+                        payloads.append(None)
+                    else:
+                        payloads.append(payload)
+
+        for key, payload in zip(pending, payloads):
+            if not payload:
+                continue
+            model = self._decode(key, payload, model_map[key])
+            if model is not None:
+                results[key] = model
+        return results
+
+    def _decode(self, key: str, payload: bytes, model_cls: Type[BaseModel]) -> Optional[BaseModel]:
         try:
-            data = json.loads(payload)
-            return model_cls.model_validate(data)
+            data = _load_payload(payload)
+            if self._validate_on_read:
+                model = model_cls.model_validate(data)
+            else:
+                model = model_cls.model_construct(**data)
+            self._l1_set(key, model)
+            return model
         except Exception:  # pragma: no cover - defensive clear path
             logger.exception("Failed to decode cached payload for key %s", key)
             if self._redis is not None:
@@ -74,77 +273,145 @@ class IndicatorCache:
                 except Exception:
                     logger.debug("Failed to delete invalid Redis entry for key %s", key)
             else:
-                with self._lock:
-                    self._store.pop(key, None)
+                store, lock = self._shard(key)
+                with lock:
+                    store.pop(key, None)
             return None
 
     def set(self, key: str, value: BaseModel) -> None:
-        payload = value.model_dump_json()
+        self._l1_set(key, value)
+        payload = _dump_payload(value)
         if self._redis is not None:
             try:
-                self._redis.setex(key, self._ttl, payload)
+                # +/-10% jitter desynchronizes expiries across processes so a
+                # hot key doesn't stampede every worker at the same instant.
+                jittered_ttl = max(1, int(self._ttl * random.uniform(0.9, 1.1)))
+                self._redis.setex(key, jittered_ttl, payload)
                 return
             except Exception as exc:  # pragma: no cover - defensive fallback
                 logger.warning("Failed to persist indicator payload to Redis (%s)", exc)
 
-        with self._lock:
-            self._store[key] = (self._now() + self._ttl, payload)
+        expires_at = self._now() + self._ttl
+        store, lock = self._shard(key)
+        with lock:
+            store[key] = (expires_at, payload)
 
     def clear(self) -> None:
+        with self._l1_lock:
+            self._l1.clear()
         if self._redis is not None:
             try:
                 self._redis.flushdb()
                 return
             except Exception:
                 logger.debug("Failed to flush Redis cache", exc_info=True)
-        with self._lock:
-            self._store.clear()
+        for store, lock in self._shards:
+            with lock:
+                store.clear()
 
 
 class IndicatorService:
     """Facade that applies caching on top of the indicator repository."""
 
+    # Shared across instances: the facade is rebuilt per request, but
+    # concurrent requests for the same key must land in one flight map.
+    _inflight: dict[str, Future] = {}
+    _inflight_lock = Lock()
+
     def __init__(self, repository: IndicatorRepository, cache: IndicatorCache) -> None:
         self._repository = repository
         self._cache = cache
 
-    @staticmethod
-    def _cache_key(prefix: str, symbol: str, timeframe: str, session: Optional[str]) -> str:
-        parts = [prefix, symbol.upper(), timeframe.lower(), (session or "*").lower()]
-        return ":".join(parts)
+    def _fetch(self, cache_key: str, model_cls: Type[BaseModel], loader: Callable[[], BaseModel]):
+        cached = self._cache.get(cache_key, model_cls)
+        if isinstance(cached, model_cls):
+            return cached
+
+        # Single-flight: when a hot key expires, only the first caller hits
+        # the repository; concurrent callers wait on its future instead of
+        # stampeding the datastore.
+        with self._inflight_lock:
+            future = self._inflight.get(cache_key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[cache_key] = future
+
+        if not owner:
+            return future.result()
+
+        try:
+            value = loader()
+            self._cache.set(cache_key, value)
+            future.set_result(value)
+            return value
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(cache_key, None)
 
     def cvd_curve(
         self, *, symbol: str, timeframe: str, session: Optional[str] = None
     ) -> CvdCurveResponse:
-        cache_key = self._cache_key("cvd", symbol, timeframe, session)
-        cached = self._cache.get(cache_key, CvdCurveResponse)
-        if isinstance(cached, CvdCurveResponse):
-            return cached
-
-        series = self._repository.cvd_curve(symbol=symbol, timeframe=timeframe, session=session)
-        self._cache.set(cache_key, series)
-        return series
+        cache_key = _cache_key("cvd", symbol, timeframe, session)
+        return self._fetch(
+            cache_key,
+            CvdCurveResponse,
+            lambda: self._repository.cvd_curve(symbol=symbol, timeframe=timeframe, session=session),
+        )
 
     def delta_oi_percent(
         self, *, symbol: str, timeframe: str, session: Optional[str] = None
     ) -> DeltaOiCurveResponse:
-        cache_key = self._cache_key("delta", symbol, timeframe, session)
-        cached = self._cache.get(cache_key, DeltaOiCurveResponse)
-        if isinstance(cached, DeltaOiCurveResponse):
-            return cached
+        cache_key = _cache_key("delta", symbol, timeframe, session)
+        return self._fetch(
+            cache_key,
+            DeltaOiCurveResponse,
+            lambda: self._repository.delta_oi_percent(
+                symbol=symbol, timeframe=timeframe, session=session
+            ),
+        )
 
-        series = self._repository.delta_oi_percent(symbol=symbol, timeframe=timeframe, session=session)
-        self._cache.set(cache_key, series)
-        return series
+    def collect_all(
+        self, *, symbol: str, timeframe: str, session: Optional[str] = None
+    ) -> Tuple[CvdCurveResponse, DeltaOiCurveResponse, VolumeProfileStatsResponse]:
+        """Fetch all three indicator responses with one batched cache read.
+
+        Cached entries come back in a single MGET round-trip; only the
+        missing indicators fall through to the per-key single-flight path.
+        """
+
+        cvd_key = _cache_key("cvd", symbol, timeframe, session)
+        delta_key = _cache_key("delta", symbol, timeframe, session)
+        profile_key = _cache_key("profile", symbol, timeframe, session)
+        model_map: Dict[str, Type[BaseModel]] = {
+            cvd_key: CvdCurveResponse,
+            delta_key: DeltaOiCurveResponse,
+            profile_key: VolumeProfileStatsResponse,
+        }
+        cached = self._cache.get_many(list(model_map), model_map)
+
+        cvd = cached.get(cvd_key) or self.cvd_curve(
+            symbol=symbol, timeframe=timeframe, session=session
+        )
+        delta = cached.get(delta_key) or self.delta_oi_percent(
+            symbol=symbol, timeframe=timeframe, session=session
+        )
+        profile = cached.get(profile_key) or self.volume_profile(
+            symbol=symbol, timeframe=timeframe, session=session
+        )
+        return cvd, delta, profile
 
     def volume_profile(
         self, *, symbol: str, timeframe: str, session: Optional[str] = None
     ) -> VolumeProfileStatsResponse:
-        cache_key = self._cache_key("profile", symbol, timeframe, session)
-        cached = self._cache.get(cache_key, VolumeProfileStatsResponse)
-        if isinstance(cached, VolumeProfileStatsResponse):
-            return cached
-
-        profile = self._repository.volume_profile(symbol=symbol, timeframe=timeframe, session=session)
-        self._cache.set(cache_key, profile)
-        return profile
+        cache_key = _cache_key("profile", symbol, timeframe, session)
+        return self._fetch(
+            cache_key,
+            VolumeProfileStatsResponse,
+            lambda: self._repository.volume_profile(
+                symbol=symbol, timeframe=timeframe, session=session
+            ),
+        )
@@ -2,14 +2,26 @@ from __future__ import annotations
 
 import asyncio
 import json
+import time
+from functools import lru_cache, partial, wraps
 from pathlib import Path
 from typing import AsyncGenerator, Dict, List, Optional
 import logging
 
+from anyio import to_thread
 from fastapi import Depends, FastAPI, HTTPException, Query, Request, status
 from fastapi.responses import HTMLResponse, PlainTextResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.middleware.gzip import GZipMiddleware
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+
+try:  # pragma: no cover - optional dependency, exercised in production only
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultJSONResponse
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+    from fastapi.responses import JSONResponse as DefaultJSONResponse
 
 from .alerting import AlertManager
 from .backtest import BacktestOverrides, BacktestReport, BacktestRunner
@@ -39,25 +51,55 @@ from .models import (
 from .signal_alerts import SignalAlertPipeline
 from .timescale_repository import TimescaleRepository, TimescaleRepositoryError
 
-app = FastAPI(title="Ingestion Monitoring Service", version="0.1.0")
+class _SelectiveGZipMiddleware(GZipMiddleware):
+    """GZip middleware that leaves the SSE stream uncompressed.
+
+    gzip buffering would hold back individual signal/heartbeat frames,
+    defeating the point of the event stream.
+    """
+
+    _EXCLUDED_PATHS = frozenset({"/api/v1/signals/stream"})
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in self._EXCLUDED_PATHS:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+app = FastAPI(
+    title="Ingestion Monitoring Service",
+    version="0.1.0",
+    default_response_class=DefaultJSONResponse,
+)
+app.add_middleware(_SelectiveGZipMiddleware, minimum_size=1024, compresslevel=5)
 logger = logging.getLogger(__name__)
 
-_governance_instance: Optional[SignalGovernance] = None
-_signal_alerts_instance: Optional[SignalAlertPipeline] = None
-_market_data_repository: Optional[MarketDataRepository] = None
-_indicator_cache_instance: Optional[IndicatorCache] = None
 _timescale_repository: Optional[TimescaleRepository] = None
 
-templates = Jinja2Templates(directory=str(Path(__file__).resolve().parent / "templates"))
-static_dir = Path(__file__).resolve().parent / "static"
-if static_dir.exists():
+_APP_DIR = Path(__file__).resolve().parent
+
+templates = Jinja2Templates(directory=str(_APP_DIR / "templates"))
+# Templates never change at runtime: skip the mtime check on every render
+# and keep compiled template bytecode across cold starts.
+templates.env.auto_reload = False
+templates.env.cache_size = 400
+templates.env.bytecode_cache = FileSystemBytecodeCache()
+
+static_dir = _APP_DIR / "static"
+_STATIC_DIR_EXISTS = static_dir.exists()
+if _STATIC_DIR_EXISTS:
     app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
 
 
+# Settings is a frozen dataclass (hashable), so these dependencies can be
+# memoized per settings instance instead of rebuilt on every request.
+@lru_cache(maxsize=8)
 def get_repository(settings: Settings = Depends(get_settings)) -> FileMetricsRepository:
     return FileMetricsRepository(settings.metrics_snapshot_path)
 
 
+@lru_cache(maxsize=8)
 def get_metrics_service(
     repo: FileMetricsRepository = Depends(get_repository),
     settings: Settings = Depends(get_settings),
@@ -65,10 +107,12 @@ def get_metrics_service(
     return MetricsService(repository=repo, settings=settings)
 
 
+@lru_cache(maxsize=8)
 def get_alert_manager(settings: Settings = Depends(get_settings)) -> AlertManager:
     return AlertManager(settings)
 
 
+@lru_cache(maxsize=8)
 def get_backtest_runner(
     repository: FileMetricsRepository = Depends(get_repository),
     settings: Settings = Depends(get_settings),
@@ -76,50 +120,45 @@ def get_backtest_runner(
     return BacktestRunner(repository=repository, settings=settings)
 
 
+@lru_cache(maxsize=8)
 def get_signal_governance(
     settings: Settings = Depends(get_settings),
 ) -> SignalGovernance:
-    global _governance_instance
-    if _governance_instance is None:
-        notifier = TelegramNotifier(
-            settings.telegram_bot_token,
-            settings.telegram_chat_id,
-        )
-        _governance_instance = SignalGovernance(
-            rules=settings.governance_rules,
-            notifier=notifier,
-        )
-    return _governance_instance
+    notifier = TelegramNotifier(
+        settings.telegram_bot_token,
+        settings.telegram_chat_id,
+    )
+    return SignalGovernance(
+        rules=settings.governance_rules,
+        notifier=notifier,
+    )
 
 
+@lru_cache(maxsize=8)
 def get_signal_alerts(
     settings: Settings = Depends(get_settings),
 ) -> SignalAlertPipeline:
-    global _signal_alerts_instance
-    if _signal_alerts_instance is None:
-        _signal_alerts_instance = SignalAlertPipeline(settings)
-    return _signal_alerts_instance
+    return SignalAlertPipeline(settings)
 
 
+@lru_cache(maxsize=1)
 def get_market_data_repository() -> MarketDataRepository:
-    global _market_data_repository
-    if _market_data_repository is None:
-        _market_data_repository = MarketDataRepository()
-    return _market_data_repository
+    return MarketDataRepository()
 
 
 def get_indicator_repository(settings: Settings = Depends(get_settings)) -> IndicatorRepository:
     return IndicatorRepository(settings.indicator_snapshot_path)
 
 
+@lru_cache(maxsize=8)
 def get_indicator_cache(settings: Settings = Depends(get_settings)) -> IndicatorCache:
-    global _indicator_cache_instance
-    if _indicator_cache_instance is None:
-        _indicator_cache_instance = IndicatorCache(
-            redis_url=settings.redis_url,
-            ttl_seconds=settings.indicator_cache_ttl_seconds,
-        )
-    return _indicator_cache_instance
+    return IndicatorCache(
+        redis_url=settings.redis_url,
+        ttl_seconds=settings.indicator_cache_ttl_seconds,
+        # Cached payloads are written by this same process, so full
+        # re-validation on read is a dev-only safety net.
+        validate_on_read=settings.environment != "production",
+    )
 
 
 def get_indicator_service(
@@ -139,6 +178,36 @@ async def get_timescale_repository(
     return _timescale_repository
 
 
+# Upper bound on (symbol, timeframe) pairs warmed at startup.
+_PREWARM_LIMIT = 8
+
+
+def _prewarm_indicator_cache(settings: Settings) -> None:
+    repository = get_indicator_repository(settings)
+    service = IndicatorService(repository=repository, cache=get_indicator_cache(settings))
+    try:
+        pairs = repository.series_pairs()
+    except IndicatorRepositoryError as exc:
+        logger.debug("Skipping indicator cache prewarm: %s", exc)
+        return
+
+    for symbol, timeframe in pairs[:_PREWARM_LIMIT]:
+        try:
+            service.collect_all(symbol=symbol, timeframe=timeframe)
+        except IndicatorRepositoryError:  # pragma: no cover - best effort
+            logger.debug("Prewarm failed for %s/%s", symbol, timeframe, exc_info=True)
+
+
+@app.on_event("startup")
+async def prewarm_indicator_cache() -> None:
+    """Warm the indicator cache in the background so the first hit is hot."""
+
+    settings = get_settings()
+    if not settings.indicator_snapshot_exists:
+        return
+    asyncio.create_task(asyncio.to_thread(_prewarm_indicator_cache, settings))
+
+
 @app.on_event("shutdown")
 async def shutdown_timescale_repository() -> None:
     global _timescale_repository
@@ -147,84 +216,130 @@ async def shutdown_timescale_repository() -> None:
         _timescale_repository = None
 
 
+def handle_metrics_errors(fn):
+    """Translate metrics-repository failures to HTTP errors in one place.
+
+    Keeps the endpoint bodies on the happy path instead of repeating the
+    same try/except block per route. Works for both sync and async handlers.
+    """
+
+    if asyncio.iscoroutinefunction(fn):
+
+        @wraps(fn)
+        async def async_wrapper(*args, **kwargs):
+            try:
+                return await fn(*args, **kwargs)
+            except MetricsRepositoryError as exc:
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)
+                ) from exc
+            except ValueError as exc:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+                ) from exc
+
+        return async_wrapper
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        except MetricsRepositoryError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)
+            ) from exc
+        except ValueError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    return wrapper
+
+
 @app.get("/", include_in_schema=False)
 def index() -> Dict[str, str]:
     return {"message": "Ingestion monitoring service", "dashboard": "/dashboard"}
 
 
+# The dashboard template is a static shell with a JSON data island: the
+# HTML renders once per process and each request only substitutes the
+# serialized metrics blob into the marker below.
+_DASHBOARD_METRICS_MARKER = b"__DASHBOARD_METRICS__"
+_dashboard_shell: Optional[bytes] = None
+
+
+def _dashboard_shell_bytes() -> bytes:
+    global _dashboard_shell
+    if _dashboard_shell is None:
+        _dashboard_shell = (
+            templates.env.get_template("dashboard.html").render().encode("utf-8")
+        )
+    return _dashboard_shell
+
+
+def _dashboard_metrics_json(metrics: AggregatedMetrics) -> bytes:
+    data = metrics.model_dump(mode="json")
+    payload = orjson.dumps(data) if orjson is not None else json.dumps(data).encode("utf-8")
+    # "</" would terminate the inline <script> data island early.
+    return payload.replace(b"</", b"<\\/")
+
+
 @app.get("/dashboard", response_class=HTMLResponse, include_in_schema=False)
-def dashboard(
+@handle_metrics_errors
+async def dashboard(
     request: Request,
     service: MetricsService = Depends(get_metrics_service),
 ) -> HTMLResponse:
-    try:
-        metrics = service.collect()
-    except MetricsRepositoryError as exc:
-        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)) from exc
-
-    return templates.TemplateResponse(
-        "dashboard.html",
-        {
-            "request": request,
-            "metrics": metrics,
-            "summary": metrics.ingestion.status,
-        },
+    metrics = await to_thread.run_sync(service.collect)
+    body = _dashboard_shell_bytes().replace(
+        _DASHBOARD_METRICS_MARKER, _dashboard_metrics_json(metrics), 1
     )
+    return HTMLResponse(content=body)
 
 
 @app.get("/api/v1/metrics", response_model=AggregatedMetrics)
-def metrics(service: MetricsService = Depends(get_metrics_service)) -> AggregatedMetrics:
-    try:
-        return service.collect()
-    except MetricsRepositoryError as exc:
-        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)) from exc
+@handle_metrics_errors
+async def metrics(service: MetricsService = Depends(get_metrics_service)) -> DefaultJSONResponse:
+    collected = await to_thread.run_sync(service.collect)
+    # Serialize once here; returning a Response bypasses jsonable_encoder.
+    return DefaultJSONResponse(content=collected.model_dump(mode="json"))
 
 
 @app.get("/api/v1/health", response_model=HealthResponse)
-def health(service: MetricsService = Depends(get_metrics_service)) -> HealthResponse:
-    try:
-        return service.health()
-    except MetricsRepositoryError as exc:
-        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)) from exc
+@handle_metrics_errors
+async def health(service: MetricsService = Depends(get_metrics_service)) -> DefaultJSONResponse:
+    report = await to_thread.run_sync(service.health)
+    return DefaultJSONResponse(content=report.model_dump(mode="json"))
 
 
 @app.get("/api/v1/governance", response_model=GovernanceStatus)
-def governance_status(
+@handle_metrics_errors
+async def governance_status(
     repository: FileMetricsRepository = Depends(get_repository),
     governance: SignalGovernance = Depends(get_signal_governance),
-) -> GovernanceStatus:
-    try:
-        snapshot = repository.fetch_snapshot()
-    except MetricsRepositoryError as exc:
-        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)) from exc
-
-    return governance.evaluate(snapshot)
+) -> DefaultJSONResponse:
+    snapshot = await to_thread.run_sync(repository.fetch_snapshot)
+    report = governance.evaluate(snapshot)
+    return DefaultJSONResponse(content=report.model_dump(mode="json"))
 
 
 @app.post("/api/v1/alerts/evaluate", response_model=AlertDispatchResult)
-def trigger_alert(
+@handle_metrics_errors
+async def trigger_alert(
     service: MetricsService = Depends(get_metrics_service),
     alert_manager: AlertManager = Depends(get_alert_manager),
-) -> AlertDispatchResult:
-    try:
-        metrics = service.collect()
-    except MetricsRepositoryError as exc:
-        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)) from exc
-
-    return alert_manager.dispatch(metrics)
+) -> DefaultJSONResponse:
+    metrics = await to_thread.run_sync(service.collect)
+    result = await to_thread.run_sync(alert_manager.dispatch, metrics)
+    return DefaultJSONResponse(content=result.model_dump(mode="json"))
 
 
 @app.post("/api/v1/alerts/signals")
-def trigger_signal_alerts(
+@handle_metrics_errors
+async def trigger_signal_alerts(
     repository: FileMetricsRepository = Depends(get_repository),
     pipeline: SignalAlertPipeline = Depends(get_signal_alerts),
 ) -> Dict[str, object]:
-    try:
-        snapshot = repository.fetch_snapshot()
-    except MetricsRepositoryError as exc:
-        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)) from exc
-
-    delivered = pipeline.process(snapshot)
+    snapshot = await to_thread.run_sync(repository.fetch_snapshot)
+    delivered = await pipeline.process_async(snapshot)
     return {"delivered_count": len(delivered), "delivered_ids": delivered}
 
 
@@ -238,7 +353,7 @@ def trigger_signal_alerts(
         503: {"description": "Indicator datastore unavailable"},
     },
 )
-def indicator_cvd(
+async def indicator_cvd(
     symbol: str = Query(
         ...,
         description="Instrument symbol to query (e.g. BTCUSDT).",
@@ -259,7 +374,9 @@ def indicator_cvd(
     """Expose the CVD curve used by the UI overlays and signal engine."""
 
     try:
-        return service.cvd_curve(symbol=symbol, timeframe=timeframe, session=session)
+        return await to_thread.run_sync(
+            partial(service.cvd_curve, symbol=symbol, timeframe=timeframe, session=session)
+        )
     except IndicatorSeriesNotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
     except IndicatorRepositoryError as exc:
@@ -276,7 +393,7 @@ def indicator_cvd(
         503: {"description": "Indicator datastore unavailable"},
     },
 )
-def indicator_delta_oi(
+async def indicator_delta_oi(
     symbol: str = Query(
         ...,
         description="Instrument symbol to query (e.g. BTCUSDT).",
@@ -297,7 +414,9 @@ def indicator_delta_oi(
     """Expose delta open interest percentage traces for downstream consumption."""
 
     try:
-        return service.delta_oi_percent(symbol=symbol, timeframe=timeframe, session=session)
+        return await to_thread.run_sync(
+            partial(service.delta_oi_percent, symbol=symbol, timeframe=timeframe, session=session)
+        )
     except IndicatorSeriesNotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
     except IndicatorRepositoryError as exc:
@@ -314,7 +433,7 @@ def indicator_delta_oi(
         503: {"description": "Indicator datastore unavailable"},
     },
 )
-def indicator_volume_profile(
+async def indicator_volume_profile(
     symbol: str = Query(
         ...,
         description="Instrument symbol to query (e.g. BTCUSDT).",
@@ -335,7 +454,9 @@ def indicator_volume_profile(
     """Expose value area, VWAP and distribution statistics for a slice."""
 
     try:
-        return service.volume_profile(symbol=symbol, timeframe=timeframe, session=session)
+        return await to_thread.run_sync(
+            partial(service.volume_profile, symbol=symbol, timeframe=timeframe, session=session)
+        )
     except IndicatorSeriesNotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
     except IndicatorRepositoryError as exc:
@@ -343,22 +464,24 @@ def indicator_volume_profile(
 
 
 @app.get("/api/v1/markets", response_model=MarketSnapshot)
-def market_snapshot(
+async def market_snapshot(
     symbols: Optional[List[str]] = Query(
         default=None,
         description="Symbols to include in the snapshot. Defaults to all tracked instruments.",
     ),
     repository: MarketDataRepository = Depends(get_market_data_repository),
-) -> MarketSnapshot:
+) -> DefaultJSONResponse:
     try:
-        snapshot = repository.market_snapshot(symbols=symbols)
+        snapshot = await to_thread.run_sync(partial(repository.market_snapshot, symbols=symbols))
     except MarketDataError as exc:
         raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)) from exc
-    return snapshot
+    # Repository output is already validated; returning a Response skips
+    # FastAPI's response_model revalidation walk.
+    return DefaultJSONResponse(content=snapshot.model_dump(mode="json"))
 
 
 @app.get("/api/v1/signals/feed", response_model=SignalFeed)
-def signal_feed(
+async def signal_feed(
     symbol: Optional[str] = Query(
         default=None,
         description="Filter feed results to a single symbol (e.g. BTCUSDT).",
@@ -372,61 +495,62 @@ def signal_feed(
         description="Filter by trading session label (asia, london, new_york).",
     ),
     repository: MarketDataRepository = Depends(get_market_data_repository),
-) -> SignalFeed:
+) -> DefaultJSONResponse:
     try:
-        feed = repository.signal_feed(symbol=symbol, confidence=confidence, session=session)
+        feed = await to_thread.run_sync(
+            partial(repository.signal_feed, symbol=symbol, confidence=confidence, session=session)
+        )
     except MarketDataError as exc:
         raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)) from exc
-    return feed
+    return DefaultJSONResponse(content=feed.model_dump(mode="json"))
 
 
 @app.get("/api/v1/signals/{signal_id}", response_model=SignalFeedItem)
-def signal_by_id(
+async def signal_by_id(
     signal_id: int,
     repository: MarketDataRepository = Depends(get_market_data_repository),
-) -> SignalFeedItem:
+) -> DefaultJSONResponse:
     try:
-        return repository.signal_by_id(signal_id)
+        item = await to_thread.run_sync(repository.signal_by_id, signal_id)
     except MarketDataError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    return DefaultJSONResponse(content=item.model_dump(mode="json"))
 
 
 @app.get("/api/v1/signals/{signal_id}/debug", response_model=SignalDebugReport)
-def signal_debug(
+async def signal_debug(
     signal_id: int,
     repository: MarketDataRepository = Depends(get_market_data_repository),
-) -> SignalDebugReport:
+) -> DefaultJSONResponse:
     try:
-        return repository.debug_signal(signal_id)
+        report = await to_thread.run_sync(repository.debug_signal, signal_id)
     except MarketDataError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    return DefaultJSONResponse(content=report.model_dump(mode="json"))
 
 
 @app.get("/api/v1/signals/stream")
 async def signal_stream(
     repository: MarketDataRepository = Depends(get_market_data_repository),
+    settings: Settings = Depends(get_settings),
 ) -> StreamingResponse:
     try:
-        items = repository.stream_items()
+        frames = repository.stream_frames()
     except MarketDataError as exc:
         raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)) from exc
 
-    async def event_iterator() -> AsyncGenerator[str, None]:
-        if not items:
-            while True:
-                await asyncio.sleep(15)
-                yield "event: heartbeat\ndata: {}\n\n"
+    event_delay = settings.signal_stream_event_delay_seconds
 
-        for item in items:
-            logger.info("Streaming signal event id=%s symbol=%s", item.id, item.symbol)
-            payload = {"signal": item.model_dump(mode="json")}
-            data = json.dumps(payload)
-            yield f"event: signal\ndata: {data}\n\n"
-            await asyncio.sleep(0.5)
+    async def event_iterator() -> AsyncGenerator[bytes, None]:
+        logger.info("Streaming %d signal events", len(frames))
+        for frame in frames:
+            yield frame
+            if event_delay > 0:
+                await asyncio.sleep(event_delay)
 
         while True:
             await asyncio.sleep(15)
-            yield "event: heartbeat\ndata: {}\n\n"
+            yield b"event: heartbeat\ndata: {}\n\n"
 
     return StreamingResponse(event_iterator(), media_type="text/event-stream")
 
@@ -540,7 +664,8 @@ async def binance_funding(
 
 
 @app.get("/api/v1/backtests/report", response_model=BacktestReport)
-def backtest_report(
+@handle_metrics_errors
+async def backtest_report(
     windows: List[int] = Query(
         default=[30, 60, 90],
         description="Window lengths (in days) to evaluate. Provide multiple values to compute several windows.",
@@ -565,23 +690,20 @@ def backtest_report(
         description="Target win rate expectation used when highlighting performance.",
     ),
     runner: BacktestRunner = Depends(get_backtest_runner),
-) -> BacktestReport:
+) -> DefaultJSONResponse:
     overrides = BacktestOverrides(
         win_return_threshold=win_return_threshold,
         loss_return_threshold=loss_return_threshold,
         min_trade_count=min_trade_count,
         min_win_rate=min_win_rate,
     )
-    try:
-        return runner.run(windows=windows, overrides=overrides)
-    except MetricsRepositoryError as exc:
-        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)) from exc
-    except ValueError as exc:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    report = await to_thread.run_sync(partial(runner.run, windows=windows, overrides=overrides))
+    return DefaultJSONResponse(content=report.model_dump(mode="json"))
 
 
 @app.get("/api/v1/backtests/report/download", response_class=StreamingResponse)
-def download_backtest_report(
+@handle_metrics_errors
+async def download_backtest_report(
     windows: List[int] = Query(
         default=[30, 60, 90],
         description="Window lengths (in days) to evaluate. Provide multiple values to compute several windows.",
@@ -613,72 +735,184 @@ def download_backtest_report(
         min_trade_count=min_trade_count,
         min_win_rate=min_win_rate,
     )
-    try:
-        report = runner.run(windows=windows, overrides=overrides)
-    except MetricsRepositoryError as exc:
-        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)) from exc
-    except ValueError as exc:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
-
-    csv_payload = runner.to_csv(report)
+    report = await to_thread.run_sync(partial(runner.run, windows=windows, overrides=overrides))
     filename = f"backtest_{report.generated_at.strftime('%Y%m%dT%H%M%SZ')}.csv"
     headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
     return StreamingResponse(
-        iter([csv_payload.encode("utf-8")]),
+        runner.iter_csv(report),
         media_type="text/csv",
         headers=headers,
     )
 
 
-@app.get("/metrics/prometheus", response_class=PlainTextResponse, include_in_schema=False)
-def prometheus_metrics(service: MetricsService = Depends(get_metrics_service)) -> PlainTextResponse:
-    try:
-        metrics = service.collect()
-    except MetricsRepositoryError as exc:
-        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)) from exc
+try:  # pragma: no cover - optional dependency, exercised in production only
+    from prometheus_client import (
+        CONTENT_TYPE_LATEST,
+        CollectorRegistry,
+        Gauge,
+        generate_latest,
+    )
+except Exception:  # pragma: no cover - prometheus_client is optional
+    CollectorRegistry = None
+
+if CollectorRegistry is not None:
+    # Dedicated registry so the exposition carries exactly our metrics;
+    # generate_latest emits bytes directly without Python-level joins.
+    _PROM_REGISTRY = CollectorRegistry()
+    _PROM_INGESTION_LATENCY = Gauge(
+        "ingestion_latency_seconds",
+        "Last recorded ingestion latency seconds",
+        registry=_PROM_REGISTRY,
+    )
+    _PROM_INGESTION_GAP = Gauge(
+        "ingestion_gap_seconds",
+        "Time since last ingestion event in seconds",
+        registry=_PROM_REGISTRY,
+    )
+    _PROM_INGESTION_LATENCY_MAX = Gauge(
+        "ingestion_latency_seconds_max",
+        "Maximum latency observed across sources",
+        registry=_PROM_REGISTRY,
+    )
+    _PROM_SIGNALS_TOTAL = Gauge(
+        "signals_generated_total", "Total signals tracked", registry=_PROM_REGISTRY
+    )
+    _PROM_SIGNALS_LAST_HOUR = Gauge(
+        "signals_last_hour",
+        "Count of signals generated in the last hour",
+        registry=_PROM_REGISTRY,
+    )
+    _PROM_WIN_RATE = Gauge(
+        "strategy_win_rate", "Strategy win rate as a ratio", registry=_PROM_REGISTRY
+    )
+    _PROM_AVG_RETURN = Gauge(
+        "strategy_average_return",
+        "Strategy average return percentage",
+        registry=_PROM_REGISTRY,
+    )
+    _PROM_SOURCE_LATENCY = Gauge(
+        "ingestion_source_latency_seconds",
+        "Latency per ingestion source",
+        ["source"],
+        registry=_PROM_REGISTRY,
+    )
+    _PROM_SIGNALS_BY_STATUS = Gauge(
+        "signals_by_status_total",
+        "Signals grouped by status",
+        ["status"],
+        registry=_PROM_REGISTRY,
+    )
+    _PROM_SIGNALS_BY_SETUP = Gauge(
+        "signals_by_setup_total",
+        "Signals grouped by setup type",
+        ["setup"],
+        registry=_PROM_REGISTRY,
+    )
+    _PROM_SIGNALS_CONFIDENCE = Gauge(
+        "signals_confidence_total",
+        "Signals grouped by setup confidence",
+        ["confidence"],
+        registry=_PROM_REGISTRY,
+    )
 
-    lines = [
-        "# HELP ingestion_latency_seconds Last recorded ingestion latency seconds",
-        "# TYPE ingestion_latency_seconds gauge",
-        f"ingestion_latency_seconds {metrics.ingestion.current_latency_seconds or 0}",
-        "# HELP ingestion_gap_seconds Time since last ingestion event in seconds",
-        "# TYPE ingestion_gap_seconds gauge",
-        f"ingestion_gap_seconds {metrics.ingestion.time_since_last_event_seconds or 0}",
-        "# HELP ingestion_latency_seconds_max Maximum latency observed across sources",
-        "# TYPE ingestion_latency_seconds_max gauge",
-        f"ingestion_latency_seconds_max {metrics.ingestion.max_latency_seconds or 0}",
-        "# HELP signals_generated_total Total signals tracked",
-        "# TYPE signals_generated_total gauge",
-        f"signals_generated_total {metrics.signals.total}",
-        "# HELP signals_last_hour Count of signals generated in the last hour",
-        "# TYPE signals_last_hour gauge",
-        f"signals_last_hour {metrics.signals.last_60_minutes}",
-        "# HELP strategy_win_rate Strategy win rate as a ratio",
-        "# TYPE strategy_win_rate gauge",
-        f"strategy_win_rate {metrics.performance.win_rate}",
-        "# HELP strategy_average_return Strategy average return percentage",
-        "# TYPE strategy_average_return gauge",
-        f"strategy_average_return {metrics.performance.avg_return_pct}",
-    ]
-
-    for source_metric in metrics.ingestion.sources:
-        lines.append(
-            f"ingestion_source_latency_seconds{{source=\"{source_metric.source}\"}} {source_metric.latency_seconds}"
-        )
 
-    for status_name, count in metrics.signals.by_status.items():
-        lines.append(
-            f"signals_by_status_total{{status=\"{status_name}\"}} {count}"
-        )
+def _prometheus_body_from_registry(metrics: AggregatedMetrics) -> bytes:
+    _PROM_INGESTION_LATENCY.set(metrics.ingestion.current_latency_seconds or 0)
+    _PROM_INGESTION_GAP.set(metrics.ingestion.time_since_last_event_seconds or 0)
+    _PROM_INGESTION_LATENCY_MAX.set(metrics.ingestion.max_latency_seconds or 0)
+    _PROM_SIGNALS_TOTAL.set(metrics.signals.total)
+    _PROM_SIGNALS_LAST_HOUR.set(metrics.signals.last_60_minutes)
+    _PROM_WIN_RATE.set(metrics.performance.win_rate)
+    _PROM_AVG_RETURN.set(metrics.performance.avg_return_pct)
+    for metric in metrics.ingestion.sources:
+        _PROM_SOURCE_LATENCY.labels(source=metric.source).set(metric.latency_seconds)
+    for name, count in metrics.signals.by_status.items():
+        _PROM_SIGNALS_BY_STATUS.labels(status=name).set(count)
+    for name, count in metrics.signals.by_setup.items():
+        _PROM_SIGNALS_BY_SETUP.labels(setup=name).set(count)
+    for name, count in metrics.signals.confidence_breakdown.items():
+        _PROM_SIGNALS_CONFIDENCE.labels(confidence=name).set(count)
+    return generate_latest(_PROM_REGISTRY)
+
+
+# Static exposition text is assembled once; only the seven scalar values are
+# interpolated per scrape. Fallback path when prometheus_client is absent.
+_PROM_TEMPLATE = (
+    "# HELP ingestion_latency_seconds Last recorded ingestion latency seconds\n"
+    "# TYPE ingestion_latency_seconds gauge\n"
+    "ingestion_latency_seconds %s\n"
+    "# HELP ingestion_gap_seconds Time since last ingestion event in seconds\n"
+    "# TYPE ingestion_gap_seconds gauge\n"
+    "ingestion_gap_seconds %s\n"
+    "# HELP ingestion_latency_seconds_max Maximum latency observed across sources\n"
+    "# TYPE ingestion_latency_seconds_max gauge\n"
+    "ingestion_latency_seconds_max %s\n"
+    "# HELP signals_generated_total Total signals tracked\n"
+    "# TYPE signals_generated_total gauge\n"
+    "signals_generated_total %s\n"
+    "# HELP signals_last_hour Count of signals generated in the last hour\n"
+    "# TYPE signals_last_hour gauge\n"
+    "signals_last_hour %s\n"
+    "# HELP strategy_win_rate Strategy win rate as a ratio\n"
+    "# TYPE strategy_win_rate gauge\n"
+    "strategy_win_rate %s\n"
+    "# HELP strategy_average_return Strategy average return percentage\n"
+    "# TYPE strategy_average_return gauge\n"
+    "strategy_average_return %s\n"
+)
 
-    for setup_name, count in metrics.signals.by_setup.items():
-        lines.append(
-            f"signals_by_setup_total{{setup=\"{setup_name}\"}} {count}"
-        )
 
-    for conf_name, count in metrics.signals.confidence_breakdown.items():
-        lines.append(
-            f"signals_confidence_total{{confidence=\"{conf_name}\"}} {count}"
+# Rendered exposition cached briefly so back-to-back scrapes (or several
+# Prometheus servers) don't redo collect() and formatting within the window.
+_PROM_BODY_TTL_SECONDS = 1.0
+_prom_body_cache: Optional[tuple[float, bytes, str]] = None
+
+
+@app.get("/metrics/prometheus", response_class=PlainTextResponse, include_in_schema=False)
+@handle_metrics_errors
+async def prometheus_metrics(service: MetricsService = Depends(get_metrics_service)) -> PlainTextResponse:
+    global _prom_body_cache
+    cached = _prom_body_cache
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < _PROM_BODY_TTL_SECONDS:
+        return PlainTextResponse(cached[1], media_type=cached[2])
+
+    metrics = await to_thread.run_sync(service.collect)
+    if CollectorRegistry is not None:
+        payload = _prometheus_body_from_registry(metrics)
+        _prom_body_cache = (now, payload, CONTENT_TYPE_LATEST)
+        return PlainTextResponse(payload, media_type=CONTENT_TYPE_LATEST)
+    scalars = _PROM_TEMPLATE % (
+        metrics.ingestion.current_latency_seconds or 0,
+        metrics.ingestion.time_since_last_event_seconds or 0,
+        metrics.ingestion.max_latency_seconds or 0,
+        metrics.signals.total,
+        metrics.signals.last_60_minutes,
+        metrics.performance.win_rate,
+        metrics.performance.avg_return_pct,
+    )
+    body = scalars + "".join(
+        (
+            "".join(
+                f'ingestion_source_latency_seconds{{source="{metric.source}"}} {metric.latency_seconds}\n'
+                for metric in metrics.ingestion.sources
+            ),
+            "".join(
+                f'signals_by_status_total{{status="{name}"}} {count}\n'
+                for name, count in metrics.signals.by_status.items()
+            ),
+            "".join(
+                f'signals_by_setup_total{{setup="{name}"}} {count}\n'
+                for name, count in metrics.signals.by_setup.items()
+            ),
+            "".join(
+                f'signals_confidence_total{{confidence="{name}"}} {count}\n'
+                for name, count in metrics.signals.confidence_breakdown.items()
+            ),
         )
+    )
 
-    return PlainTextResponse("\n".join(lines) + "\n")
+    # Encode once so the cached scrape payload is reusable bytes.
+    encoded = body.encode("utf-8")
+    _prom_body_cache = (now, encoded, "text/plain; version=0.0.4")
+    return PlainTextResponse(encoded, media_type="text/plain; version=0.0.4")
@@ -1,8 +1,19 @@
 from __future__ import annotations
 
 import json
+import mmap
+import os
+import pickle
 from pathlib import Path
-from typing import Iterable, List, Optional
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+try:  # pragma: no cover - optional dependency, exercised in production only
+    import orjson
+except Exception:  # pragma: no cover - orjson is optional
+    orjson = None
 
 from .market_models import (
     MarketDataset,
@@ -15,38 +26,254 @@ from .market_models import (
 
 DEFAULT_MARKET_DATA_PATH = Path(__file__).resolve().parent / "data" / "sample_market_data.json"
 
+# Below this size the mmap setup costs more than the copy it avoids.
+_MMAP_THRESHOLD_BYTES = 64 * 1024
+
+
+# Index into _CONFIDENCE_WEIGHTS; unknown/missing confidence maps to 0.5.
+_CONFIDENCE_INDEX = {"low": 0, "medium": 2, "high": 3}
+_CONFIDENCE_WEIGHTS = np.array([0.35, 0.5, 0.65, 1.0])
+
+
+def _build_debug_reports(signals: List[SignalFeedItem]) -> Dict[int, SignalDebugReport]:
+    """Compute naive debug contributions for all signals in one pass.
+
+    The clamps and weighted sum run as NumPy array arithmetic; only the
+    final rounding happens per item so the output matches the previous
+    scalar computation exactly.
+    """
+
+    if not signals:
+        return {}
+
+    conf_idx = np.fromiter(
+        (
+            _CONFIDENCE_INDEX.get((signal.confidence or "").lower(), 1)
+            for signal in signals
+        ),
+        dtype=np.intp,
+        count=len(signals),
+    )
+    delta = np.fromiter(
+        (
+            signal.delta_oi_pct if signal.delta_oi_pct is not None else 0.0
+            for signal in signals
+        ),
+        dtype=np.float64,
+        count=len(signals),
+    )
+    cvd = np.fromiter(
+        (signal.cvd if signal.cvd is not None else 0.0 for signal in signals),
+        dtype=np.float64,
+        count=len(signals),
+    )
+
+    conf_w = _CONFIDENCE_WEIGHTS[conf_idx]
+    delta_w = np.clip(delta, 0.0, 1.0)
+    cvd_w = np.clip(cvd / 2000.0, 0.0, 1.0)
+
+    reports: Dict[int, SignalDebugReport] = {}
+    for position, signal in enumerate(signals):
+        confidence_weight = round(float(conf_w[position]), 3)
+        delta_oi_weight = round(float(delta_w[position]), 3)
+        cvd_weight = round(float(cvd_w[position]), 3)
+        contributions = {
+            "confidence_weight": confidence_weight,
+            "delta_oi_weight": delta_oi_weight,
+            "cvd_weight": cvd_weight,
+        }
+        total_score = round(
+            confidence_weight * 0.4 + delta_oi_weight * 0.4 + cvd_weight * 0.2,
+            3,
+        )
+        reports[signal.id] = SignalDebugReport(
+            signal_id=signal.id,
+            symbol=signal.symbol,
+            confidence=signal.confidence,
+            session=signal.session,
+            tier=signal.tier,
+            contributions=contributions,
+            total_score=total_score,
+        )
+    return reports
+
+
+def _dumps_bytes(payload: object) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
 
 class MarketDataError(RuntimeError):
     """Raised when the market data snapshot cannot be loaded."""
 
 
+class _DatasetIndex:
+    """Per-dataset lookup structures built once per snapshot load.
+
+    Turns the per-request linear scans over the signal list into dict
+    lookups (by id) and precomputed position lists (by filter value).
+    """
+
+    __slots__ = (
+        "by_id",
+        "by_symbol",
+        "by_confidence",
+        "by_session",
+        "debug_by_id",
+        "filters",
+        "market_symbols_upper",
+        "sse_frames",
+    )
+
+    def __init__(self, dataset: MarketDataset) -> None:
+        self.by_id: Dict[int, SignalFeedItem] = {}
+        self.by_symbol: Dict[str, List[int]] = {}
+        self.by_confidence: Dict[str, List[int]] = {}
+        self.by_session: Dict[str, List[int]] = {}
+        self.debug_by_id: Dict[int, SignalDebugReport] = _build_debug_reports(
+            list(dataset.signals)
+        )
+
+        symbol_values: set = set()
+        confidence_values: set = set()
+        session_values: set = set(dataset.sessions)
+        for position, item in enumerate(dataset.signals):
+            self.by_id[item.id] = item
+            self.by_symbol.setdefault(item.symbol.upper(), []).append(position)
+            symbol_values.add(item.symbol)
+            if item.confidence:
+                self.by_confidence.setdefault(item.confidence.lower(), []).append(position)
+                confidence_values.add(item.confidence)
+            if item.session:
+                self.by_session.setdefault(item.session.lower(), []).append(position)
+                session_values.add(item.session)
+
+        # Uppercased market symbols, parallel to dataset.markets, so the
+        # snapshot filter compares without per-request str.upper calls.
+        self.market_symbols_upper: List[str] = [
+            market.symbol.upper() for market in dataset.markets
+        ]
+
+        self.filters = SignalFeedFilters(
+            symbols=sorted(symbol_values),
+            confidences=sorted(confidence_values),
+            sessions=sorted(session for session in session_values if session),
+        )
+
+        # SSE frames are identical for every connected client, so encode
+        # each signal exactly once per snapshot load.
+        self.sse_frames: List[bytes] = [
+            b"event: signal\ndata: " + _dumps_bytes({"signal": item.model_dump(mode="json")}) + b"\n\n"
+            for item in dataset.signals
+        ]
+
+
 class MarketDataRepository:
-    """Loads market structure, indicator overlays, and signal feed metadata."""
+    """Loads market structure, indicator overlays, and signal feed metadata.
+
+    The parsed dataset and its ``_DatasetIndex`` are treated as immutable
+    between reloads: lookups hand out references to the cached models, and
+    a new dataset/index pair is only built when the snapshot file's mtime
+    changes. Callers must not mutate returned items.
+    """
 
     def __init__(self, data_path: Optional[Path] = None) -> None:
         self._data_path = data_path or DEFAULT_MARKET_DATA_PATH
+        # Parsed dataset keyed by file mtime so hot requests skip the JSON
+        # parse and pydantic validation entirely until the snapshot changes.
+        self._cached: Optional[Tuple[Tuple[int, int], MarketDataset, _DatasetIndex]] = None
+        self._cache_lock = Lock()
 
     def _load_dataset(self) -> MarketDataset:
-        if not self._data_path.exists():
-            raise MarketDataError(f"Market data snapshot not found at {self._data_path}")
+        return self._load_indexed()[0]
+
+    def _load_indexed(self) -> Tuple[MarketDataset, _DatasetIndex]:
+        try:
+            stat = self._data_path.stat()
+        except OSError as exc:
+            raise MarketDataError(f"Market data snapshot not found at {self._data_path}") from exc
+        # Size guards against writers that preserve the mtime on rewrite.
+        cache_key = (stat.st_mtime_ns, stat.st_size)
+
+        cached = self._cached
+        if cached is not None and cached[0] == cache_key:
+            return cached[1], cached[2]
+
+        with self._cache_lock:
+            cached = self._cached
+            if cached is not None and cached[0] == cache_key:
+                return cached[1], cached[2]
 
+            dataset = self._load_pickle_cache(stat.st_mtime_ns)
+            if dataset is None:
+                try:
+                    # Large snapshots are mapped instead of copied into a fresh
+                    # bytes object and parsed with orjson when available; the
+                    # bytes path hands raw JSON straight to pydantic-core, which
+                    # fuses parsing and validation and skips the intermediate
+                    # Python dict entirely.
+                    if orjson is not None and stat.st_size >= _MMAP_THRESHOLD_BYTES:
+                        with self._data_path.open("rb") as handle:
+                            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                                payload = orjson.loads(memoryview(mapped))
+                        dataset = MarketDataset.model_validate(payload)
+                    else:
+                        dataset = MarketDataset.model_validate_json(self._data_path.read_bytes())
+                except OSError as exc:
+                    raise MarketDataError(f"Market data snapshot not found at {self._data_path}") from exc
+                except ValueError as exc:  # pragma: no cover - defensive, difficult to trigger
+                    # Covers stdlib json, orjson, and pydantic-core decode errors,
+                    # all of which subclass ValueError.
+                    raise MarketDataError("Invalid market data JSON") from exc
+                self._write_pickle_cache(dataset)
+
+            index = _DatasetIndex(dataset)
+            self._cached = (cache_key, dataset, index)
+            return dataset, index
+
+    def _pickle_cache_path(self) -> Path:
+        return self._data_path.with_suffix(".pkl")
+
+    def _load_pickle_cache(self, snapshot_mtime_ns: int) -> Optional[MarketDataset]:
+        """Load the pre-validated dataset pickle if it is at least as fresh
+        as the JSON snapshot; any failure falls back to the JSON path."""
+
+        cache_path = self._pickle_cache_path()
         try:
-            with self._data_path.open("r", encoding="utf-8") as handle:
-                payload = json.load(handle)
-        except json.JSONDecodeError as exc:  # pragma: no cover - defensive, difficult to trigger
-            raise MarketDataError("Invalid market data JSON") from exc
+            if cache_path.stat().st_mtime_ns < snapshot_mtime_ns:
+                return None
+            cached = pickle.loads(cache_path.read_bytes())
+        except Exception:  # pragma: no cover - stale/incompatible cache is not an error
+            return None
+        return cached if isinstance(cached, MarketDataset) else None
 
-        return MarketDataset.model_validate(payload)
+    def _write_pickle_cache(self, dataset: MarketDataset) -> None:
+        cache_path = self._pickle_cache_path()
+        tmp_path = cache_path.with_suffix(".pkl.tmp")
+        try:
+            tmp_path.write_bytes(pickle.dumps(dataset, protocol=pickle.HIGHEST_PROTOCOL))
+            os.replace(tmp_path, cache_path)
+        except OSError:  # pragma: no cover - read-only data dir, skip the warm cache
+            pass
 
     def market_snapshot(self, symbols: Optional[Iterable[str]] = None) -> MarketSnapshot:
-        dataset = self._load_dataset()
+        dataset, index = self._load_indexed()
         if symbols:
             requested = {symbol.upper() for symbol in symbols}
-            markets = [market for market in dataset.markets if market.symbol.upper() in requested]
+            markets = [
+                market
+                for market, symbol_key in zip(dataset.markets, index.market_symbols_upper)
+                if symbol_key in requested
+            ]
         else:
             markets = list(dataset.markets)
 
-        return MarketSnapshot(generated_at=dataset.generated_at, markets=markets)
+        # Everything here came out of the validated dataset, so skip the
+        # re-validation walk the normal constructor would run.
+        return MarketSnapshot.model_construct(
+            generated_at=dataset.generated_at, markets=markets
+        )
 
     def signal_feed(
         self,
@@ -55,89 +282,59 @@ class MarketDataRepository:
         confidence: Optional[str] = None,
         session: Optional[str] = None,
     ) -> SignalFeed:
-        dataset = self._load_dataset()
-        items: List[SignalFeedItem] = list(dataset.signals)
-
-        if symbol:
-            requested_symbol = symbol.upper()
-            items = [item for item in items if item.symbol.upper() == requested_symbol]
-        if confidence:
-            requested_confidence = confidence.lower()
-            items = [
-                item
-                for item in items
-                if (item.confidence or "").lower() == requested_confidence
-            ]
-        if session:
-            requested_session = session.lower()
-            items = [
-                item
-                for item in items
-                if (item.session or "").lower() == requested_session
-            ]
+        dataset, index = self._load_indexed()
 
-        symbol_filter = sorted({item.symbol for item in dataset.signals})
-        confidence_filter = sorted({item.confidence for item in dataset.signals if item.confidence})
-        session_values = set(dataset.sessions)
-        session_values.update(item.session for item in dataset.signals if item.session)
-        session_filter = sorted(session for session in session_values if session)
+        buckets: List[List[int]] = []
+        for lookup, value in (
+            (index.by_symbol, symbol.upper() if symbol else None),
+            (index.by_confidence, confidence.lower() if confidence else None),
+            (index.by_session, session.lower() if session else None),
+        ):
+            if value is not None:
+                buckets.append(lookup.get(value, []))
 
-        filters = SignalFeedFilters(
-            symbols=symbol_filter,
-            confidences=confidence_filter,
-            sessions=session_filter,
-        )
+        selected: Optional[set] = None
+        if buckets:
+            # Intersect starting from the smallest bucket so the working
+            # set never grows past the most selective filter.
+            buckets.sort(key=len)
+            selected = set(buckets[0])
+            for positions in buckets[1:]:
+                selected.intersection_update(positions)
 
-        return SignalFeed(generated_at=dataset.generated_at, signals=items, filters=filters)
+        if selected is None:
+            # No copy needed: SignalFeed validation builds its own list.
+            items: List[SignalFeedItem] = dataset.signals
+        else:
+            items = [dataset.signals[position] for position in sorted(selected)]
+
+        return SignalFeed.model_construct(
+            generated_at=dataset.generated_at, signals=items, filters=index.filters
+        )
 
     def stream_items(self) -> List[SignalFeedItem]:
         dataset = self._load_dataset()
         return list(dataset.signals)
 
+    def stream_frames(self) -> List[bytes]:
+        """Prebuilt SSE frames, one per signal, shared across clients."""
+
+        _, index = self._load_indexed()
+        return index.sse_frames
+
     def signal_by_id(self, signal_id: int) -> SignalFeedItem:
-        dataset = self._load_dataset()
-        for item in dataset.signals:
-            if item.id == signal_id:
-                return item
-        raise MarketDataError(f"Signal with id {signal_id} not found")
+        _, index = self._load_indexed()
+        item = index.by_id.get(signal_id)
+        if item is None:
+            raise MarketDataError(f"Signal with id {signal_id} not found")
+        return item
 
     def debug_signal(self, signal_id: int) -> SignalDebugReport:
-        signal = self.signal_by_id(signal_id)
-        # Compute naive contributions for debug/inspection purposes.
-        conf = (signal.confidence or "").lower()
-        confidence_weight = {"high": 1.0, "medium": 0.65, "low": 0.35}.get(conf, 0.5)
-        delta_weight = signal.delta_oi_pct if signal.delta_oi_pct is not None else 0.0
-        if delta_weight < 0:
-            delta_weight = 0.0
-        if delta_weight > 1.0:
-            delta_weight = 1.0
-        cvd_raw = signal.cvd if signal.cvd is not None else 0.0
-        cvd_weight = cvd_raw / 2000.0
-        if cvd_weight < 0:
-            cvd_weight = 0.0
-        if cvd_weight > 1.0:
-            cvd_weight = 1.0
-
-        contributions = {
-            "confidence_weight": round(confidence_weight, 3),
-            "delta_oi_weight": round(delta_weight, 3),
-            "cvd_weight": round(cvd_weight, 3),
-        }
-        total_score = round(
-            contributions["confidence_weight"] * 0.4
-            + contributions["delta_oi_weight"] * 0.4
-            + contributions["cvd_weight"] * 0.2,
-            3,
-        )
-        return SignalDebugReport(
-            signal_id=signal.id,
-            symbol=signal.symbol,
-            confidence=signal.confidence,
-            session=signal.session,
-            tier=signal.tier,
-            contributions=contributions,
-            total_score=total_score,
-        )
+        _, index = self._load_indexed()
+        report = index.debug_by_id.get(signal_id)
+        if report is None:
+            raise MarketDataError(f"Signal with id {signal_id} not found")
+        return report
 
     @property
     def data_path(self) -> Path:
@@ -1,17 +1,26 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional, Dict
+from functools import cached_property
+from typing import List, Optional, Dict, Tuple
 
+import numpy as np
 from pydantic import BaseModel, Field
 
 
-class PricePoint(BaseModel):
+# The point types exist in the thousands per dataset; slotted dataclasses
+# construct far faster than BaseModel and drop the per-instance __dict__.
+# pydantic still validates and serializes them wherever they appear as
+# model fields, so the API schema is unchanged.
+@dataclass(slots=True, frozen=True)
+class PricePoint:
     time: datetime
     close: float
 
 
-class SeriesPoint(BaseModel):
+@dataclass(slots=True, frozen=True)
+class SeriesPoint:
     time: datetime
     value: float
 
@@ -33,6 +42,13 @@ class EntryZone(BaseModel):
     label: Optional[str] = None
 
 
+def _series_values(points: List[SeriesPoint]) -> np.ndarray:
+    ordered = sorted(points, key=lambda point: point.time)
+    return np.fromiter(
+        (point.value for point in ordered), dtype=np.float64, count=len(ordered)
+    )
+
+
 class MarketInstrument(BaseModel):
     symbol: str
     price: List[PricePoint]
@@ -41,6 +57,30 @@ class MarketInstrument(BaseModel):
     volume_levels: VolumeLevels
     entry_zones: List[EntryZone] = Field(default_factory=list)
 
+    # Structure-of-arrays views over the point lists, built lazily and
+    # cached for the lifetime of the instrument. The JSON shape stays
+    # point-per-object; these columns exist for numeric consumers so they
+    # stop iterating thousands of per-point models.
+
+    @cached_property
+    def sorted_price(self) -> List[PricePoint]:
+        return sorted(self.price, key=lambda point: point.time)
+
+    @cached_property
+    def price_closes(self) -> np.ndarray:
+        ordered = self.sorted_price
+        return np.fromiter(
+            (point.close for point in ordered), dtype=np.float64, count=len(ordered)
+        )
+
+    @cached_property
+    def cvd_values(self) -> np.ndarray:
+        return _series_values(self.cvd)
+
+    @cached_property
+    def delta_oi_values(self) -> np.ndarray:
+        return _series_values(self.delta_oi_pct)
+
 
 class MarketPoint(BaseModel):
     price: PricePoint
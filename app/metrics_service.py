@@ -1,10 +1,16 @@
 from __future__ import annotations
 
-from collections import Counter
 from datetime import datetime, timedelta, timezone
 from statistics import mean
 from typing import Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
+
+try:  # pragma: no cover - optional dependency, exercised in production only
+    from numba import njit
+except Exception:  # pragma: no cover - numba is optional
+    njit = None
+
 from .config import Settings
 from .data_source import FileMetricsRepository
 from .models import (
@@ -23,12 +29,42 @@ def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def _ingestion_reduce(latencies: np.ndarray, received_ns: np.ndarray) -> Tuple[float, float, int]:
+    """Reduce the ingestion columns to (latency sum, latency max, latest index)."""
+
+    total = 0.0
+    max_latency = 0.0
+    latest_idx = 0
+    latest_ns = received_ns[0]
+    for position in range(latencies.shape[0]):
+        total += latencies[position]
+        if latencies[position] > max_latency:
+            max_latency = latencies[position]
+        if received_ns[position] > latest_ns:
+            latest_ns = received_ns[position]
+            latest_idx = position
+    return total, max_latency, latest_idx
+
+
+if njit is not None:  # pragma: no cover - compiled path needs numba installed
+    _ingestion_reduce = njit(cache=True)(_ingestion_reduce)
+else:
+
+    def _ingestion_reduce(latencies: np.ndarray, received_ns: np.ndarray) -> Tuple[float, float, int]:  # noqa: F811
+        # Without numba the vectorized reductions beat the Python loop.
+        return float(latencies.sum()), float(latencies.max()), int(received_ns.argmax())
+
+
 class MetricsService:
     """Aggregates ingestion and performance data into monitoring friendly structures."""
 
     def __init__(self, repository: FileMetricsRepository, settings: Settings) -> None:
         self._repository = repository
         self._settings = settings
+        # Ingestion columns keyed on the event list identity: the repository
+        # hands back the same cached snapshot until the file changes, so
+        # repeated collect() calls reuse the arrays.
+        self._ingestion_columns: Optional[Tuple[List, np.ndarray, np.ndarray]] = None
 
     def _summarise_ingestion(self, snapshot: MetricsSnapshot, now: datetime) -> IngestionSummary:
         events = snapshot.ingestions
@@ -44,20 +80,32 @@ class MetricsService:
                 time_since_last_event_seconds=None,
             )
 
-        latest_event = max(events, key=lambda event: event.received_at)
-        average_latency = mean(event.latency_seconds for event in events)
-        max_latency = max(event.latency_seconds for event in events)
-        time_since_last = max((now - latest_event.received_at).total_seconds(), 0.0)
+        # The numeric reductions run over cached NumPy columns (compiled by
+        # numba when available); only the per-source latest tracking still
+        # needs the Python pass over the events.
+        latencies, received_ns = self._ingestion_arrays(events)
+        latency_sum, max_latency, latest_idx = _ingestion_reduce(latencies, received_ns)
+        latest_event = events[latest_idx]
 
-        per_source: Dict[str, IngestionSourceMetric] = {}
+        # Track bare (timestamp, latency) tuples during the scan and only
+        # materialize one model per unique source at the end.
+        latest_per_source: Dict[str, Tuple[datetime, float]] = {}
         for event in events:
-            current = per_source.get(event.source)
-            if current is None or event.received_at > current.latest_timestamp:
-                per_source[event.source] = IngestionSourceMetric(
-                    source=event.source,
-                    latest_timestamp=event.received_at,
-                    latency_seconds=event.latency_seconds,
-                )
+            current = latest_per_source.get(event.source)
+            if current is None or event.received_at > current[0]:
+                latest_per_source[event.source] = (event.received_at, event.latency_seconds)
+
+        sources = [
+            IngestionSourceMetric(
+                source=source,
+                latest_timestamp=received_at,
+                latency_seconds=latency_seconds,
+            )
+            for source, (received_at, latency_seconds) in sorted(latest_per_source.items())
+        ]
+
+        average_latency = latency_sum / len(events)
+        time_since_last = max((now - latest_event.received_at).total_seconds(), 0.0)
 
         status = self._evaluate_ingestion_status(
             current_latency=latest_event.latency_seconds,
@@ -71,11 +119,28 @@ class MetricsService:
             current_latency_seconds=latest_event.latency_seconds,
             average_latency_seconds=average_latency,
             max_latency_seconds=max_latency,
-            sources=sorted(per_source.values(), key=lambda item: item.source),
+            sources=sources,
             status=status,
             time_since_last_event_seconds=time_since_last,
         )
 
+    def _ingestion_arrays(self, events: List) -> Tuple[np.ndarray, np.ndarray]:
+        cached = self._ingestion_columns
+        if cached is not None and cached[0] is events:
+            return cached[1], cached[2]
+
+        count = len(events)
+        latencies = np.fromiter(
+            (event.latency_seconds for event in events), dtype=np.float64, count=count
+        )
+        received_ns = np.fromiter(
+            (int(event.received_at.timestamp() * 1_000_000_000) for event in events),
+            dtype=np.int64,
+            count=count,
+        )
+        self._ingestion_columns = (events, latencies, received_ns)
+        return latencies, received_ns
+
     def _evaluate_ingestion_status(
         self,
         current_latency: float,
@@ -112,52 +177,61 @@ class MetricsService:
                 average_score=None,
             )
 
-        status_counts = Counter(signal.status for signal in signals)
-        last_60 = sum(1 for signal in signals if now - signal.generated_at <= timedelta(hours=1))
-        last_24 = sum(1 for signal in signals if now - signal.generated_at <= timedelta(hours=24))
+        # Hoisting the cutoffs turns the recency checks into plain datetime
+        # comparisons, and one loop replaces the separate Counter/sum/list
+        # passes over the signal list.
+        cutoff_60 = now - timedelta(hours=1)
+        cutoff_24 = now - timedelta(hours=24)
+        status_counts: Dict[str, int] = {}
+        setup_counts: Dict[str, int] = {}
+        confidence_counts: Dict[str, int] = {}
+        score_values: List[float] = []
+        cadence_values: List[float] = []
+        last_60 = 0
+        last_24 = 0
+        for signal in signals:
+            status_counts[signal.status] = status_counts.get(signal.status, 0) + 1
+            if signal.generated_at >= cutoff_60:
+                last_60 += 1
+            if signal.generated_at >= cutoff_24:
+                last_24 += 1
+            if signal.cadence_seconds is not None:
+                cadence_values.append(signal.cadence_seconds)
+            setup = signal.setup
+            if setup is not None:
+                setup_type = setup.type.value
+                setup_counts[setup_type] = setup_counts.get(setup_type, 0) + 1
+                confidence = setup.confidence.value
+                confidence_counts[confidence] = confidence_counts.get(confidence, 0) + 1
+                score_values.append(setup.score)
 
-        cadence_values: List[float] = [
-            signal.cadence_seconds for signal in signals if signal.cadence_seconds is not None
-        ]
         if len(signals) > 1 and not cadence_values:
-            # derive cadence from inter-arrival times if cadence_seconds missing
-            ordered = sorted(signals, key=lambda signal: signal.generated_at)
-            diffs = [
-                (later.generated_at - earlier.generated_at).total_seconds()
-                for earlier, later in zip(ordered[:-1], ordered[1:])
-                if later.generated_at > earlier.generated_at
-            ]
-            cadence_values = diffs
-        cadence_avg = mean(cadence_values) if cadence_values else None
-
-        setup_counts = Counter(
-            signal.setup.type.value
-            for signal in signals
-            if signal.setup is not None
-        )
-        confidence_counts = Counter(
-            signal.setup.confidence.value
-            for signal in signals
-            if signal.setup is not None
-        )
-        score_values = [
-            signal.setup.score
-            for signal in signals
-            if signal.setup is not None
-        ]
+            # derive cadence from inter-arrival times if cadence_seconds missing;
+            # a running previous-timestamp avoids slicing the sorted list twice
+            diff_sum = 0.0
+            diff_count = 0
+            previous: Optional[datetime] = None
+            for signal in sorted(signals, key=lambda signal: signal.generated_at):
+                if previous is not None and signal.generated_at > previous:
+                    diff_sum += (signal.generated_at - previous).total_seconds()
+                    diff_count += 1
+                previous = signal.generated_at
+            cadence_avg = diff_sum / diff_count if diff_count else None
+        else:
+            cadence_avg = mean(cadence_values) if cadence_values else None
         average_score = mean(score_values) if score_values else None
 
         status = self._evaluate_signal_status(last_60, cadence_avg)
 
         return SignalSummary(
             total=len(signals),
-            by_status=dict(status_counts),
+            by_status=status_counts,
             last_60_minutes=last_60,
             last_24_hours=last_24,
             cadence_seconds_avg=cadence_avg,
             status=status,
-            by_setup=dict(setup_counts),
-            confidence_breakdown=dict(confidence_counts),
+            by_setup=setup_counts,
+            confidence_breakdown=confidence_counts,
             average_score=average_score,
         )
 
@@ -186,11 +260,22 @@ class MetricsService:
                 status=HealthStatus.WARNING,
             )
 
-        wins = sum(1 for exec_event in executions if exec_event.outcome.lower() == "win")
-        losses = sum(1 for exec_event in executions if exec_event.outcome.lower() == "loss")
+        # One pass lowercases each outcome exactly once and accumulates the
+        # return sum alongside the win/loss tallies.
+        wins = 0
+        losses = 0
+        return_sum = 0.0
+        for exec_event in executions:
+            outcome = exec_event.outcome.lower()
+            if outcome == "win":
+                wins += 1
+            elif outcome == "loss":
+                losses += 1
+            return_sum += exec_event.return_pct
+
         total_tracked = wins + losses
         win_rate = wins / total_tracked if total_tracked else 0.0
-        avg_return = mean(exec_event.return_pct for exec_event in executions)
+        avg_return = return_sum / len(executions)
 
         thresholds = self._settings.thresholds
         if total_tracked == 0:
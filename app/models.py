@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, field_validator
 
 
 class HealthStatus(str, Enum):
@@ -42,6 +43,7 @@ class VolumeProfileBin(BaseModel):
 class VolumeProfile(BaseModel):
     bins: List[VolumeProfileBin]
     value_area: Optional[Tuple[float, float]] = None
+    total_volume: float = 0.0
 
 
 class SignalSetup(BaseModel):
@@ -55,6 +57,10 @@ class SignalSetup(BaseModel):
 class SignalEvent(BaseModel):
     id: int
     symbol: str
+    status: str = Field(
+        default="active",
+        description="Lifecycle status of the signal (e.g. active, stale, paused).",
+    )
 
     generated_at: datetime
     cadence_seconds: Optional[float] = None
@@ -66,6 +72,15 @@ class SignalEvent(BaseModel):
     outcome: Optional[str] = None
     return_pct: Optional[float] = Field(default=None, description="Realised return as fraction (0.05 = 5%)")
 
+    @field_validator("generated_at")
+    @classmethod
+    def _normalise_generated_at(cls, value: datetime) -> datetime:
+        # Normalize naive timestamps to UTC-aware once at construction so
+        # consumers can compare generated_at without per-call tzinfo checks.
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value
+
 
 class ExecutionEvent(BaseModel):
     signal_id: int
@@ -80,7 +95,8 @@ class MetricsSnapshot(BaseModel):
     executions: List[ExecutionEvent]
 
 
-class IngestionSourceMetric(BaseModel):
+@dataclass(slots=True, frozen=True)
+class IngestionSourceMetric:
     source: str
     latest_timestamp: datetime
     latency_seconds: float
@@ -4,7 +4,15 @@ from __future__ import annotations
 
 from datetime import datetime
 
-__all__ = ["determine_session"]
+import numpy as np
+
+__all__ = ["determine_session", "determine_sessions"]
+
+# Session label per UTC hour; a tuple subscript replaces the branch chain
+# in determine_session, which runs once per trade/candle/sample.
+_SESSION_BY_HOUR = ("asia",) * 8 + ("london",) * 8 + ("new_york",) * 8
+
+_SESSION_ARRAY = np.array(_SESSION_BY_HOUR, dtype=object)
 
 
 def determine_session(timestamp: datetime) -> str:
@@ -25,9 +33,18 @@ def determine_session(timestamp: datetime) -> str:
         Session label (``asia``, ``london`` or ``new_york``).
     """
 
-    hour = timestamp.hour
-    if 0 <= hour < 8:
-        return "asia"
-    if 8 <= hour < 16:
-        return "london"
-    return "new_york"
+    return _SESSION_BY_HOUR[timestamp.hour]
+
+
+def determine_sessions(hours: np.ndarray) -> np.ndarray:
+    """Classify a batch of UTC hours in one indexed gather.
+
+    Args:
+        hours: Integer array of UTC hours (0-23), e.g. collected once from a
+            trade or candle batch.
+
+    Returns:
+        Object array of session labels aligned with ``hours``.
+    """
+
+    return _SESSION_ARRAY[hours]
@@ -1,19 +1,30 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import random
+from bisect import bisect_right
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta
 from typing import List, Optional, Sequence, Tuple
 
 import httpx
 
+try:  # pragma: no cover - optional dependency, exercised in production only
+    import orjson
+except Exception:  # pragma: no cover - orjson is optional
+    orjson = None
+
 from .config import Settings
 from .models import MetricsSnapshot, SignalConfidence, SignalEvent, SignalSetupType
 
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SignalAlertConfig:
     enabled: bool = False
     include_medium_confidence: bool = False
@@ -23,7 +34,16 @@ class SignalAlertConfig:
 
 
 class TelegramBot:
-    """Thin Telegram bot sender with basic retry and logging."""
+    """Thin Telegram bot sender with basic retry and logging.
+
+    Single messages go through the synchronous :meth:`send`; alert bursts
+    should use :meth:`send_many`, which overlaps the requests on a shared
+    ``httpx.AsyncClient`` so N alerts cost roughly one round trip instead
+    of N sequential ones.
+    """
+
+    # Telegram caps bots at ~30 messages per second.
+    _MAX_CONCURRENT_SENDS = 30
 
     def __init__(
         self,
@@ -37,12 +57,9 @@ class TelegramBot:
         self._chat_id = chat_id
         self._timeout = timeout
         self._max_retries = max(1, max_retries)
+        self._async_client: Optional[httpx.AsyncClient] = None
 
-    def send(self, message: str) -> bool:
-        if not self._bot_token or not self._chat_id:
-            logger.debug("Telegram bot token or chat id not configured; skipping send")
-            return False
-
+    def _send_url_payload(self, message: str) -> Tuple[str, dict]:
         url = f"https://api.telegram.org/bot{self._bot_token}/sendMessage"
         payload = {
             "chat_id": self._chat_id,
@@ -50,7 +67,105 @@ class TelegramBot:
             # Keep plain text to avoid markup rendering issues in tests/integrations.
             # "parse_mode": "MarkdownV2",
         }
+        return url, payload
+
+    def _client(self) -> httpx.AsyncClient:
+        # Lazily created so synchronous callers never pay for it; reused
+        # across bursts to keep the TCP/TLS session warm. A small keep-alive
+        # pool is plenty — everything goes to the one Telegram host.
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                timeout=self._timeout,
+                limits=httpx.Limits(
+                    max_keepalive_connections=2,
+                    max_connections=self._MAX_CONCURRENT_SENDS,
+                ),
+            )
+        return self._async_client
+
+    async def aclose(self) -> None:
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    @staticmethod
+    def _retry_after_seconds(response: Optional[httpx.Response]) -> float:
+        """Extract the FloodWait duration from a 429 response, defaulting to 1s."""
+
+        if response is None:
+            return 1.0
+        try:
+            retry_after = response.json()["parameters"]["retry_after"]
+        except Exception:
+            retry_after = response.headers.get("Retry-After")
+        try:
+            return max(0.0, float(retry_after))
+        except (TypeError, ValueError):
+            return 1.0
+
+    async def send_async(self, message: str) -> bool:
+        if not self._bot_token or not self._chat_id:
+            logger.debug("Telegram bot token or chat id not configured; skipping send")
+            return False
 
+        url, payload = self._send_url_payload(message)
+        if orjson is not None:
+            # Pre-encode with orjson so retries reuse the bytes and httpx
+            # skips its slower stdlib-json serialization.
+            request_kwargs = {"content": orjson.dumps(payload), "headers": _JSON_HEADERS}
+        else:
+            request_kwargs = {"json": payload}
+        last_error: Optional[Exception] = None
+        attempt = 1
+        flood_waits = 0
+        while attempt <= self._max_retries:
+            try:
+                response = await self._client().post(url, **request_kwargs)
+                response.raise_for_status()
+                logger.info("Delivered Telegram alert (attempt %s)", attempt)
+                return True
+            except httpx.HTTPStatusError as exc:
+                last_error = exc
+                status_code = exc.response.status_code if exc.response is not None else None
+                if status_code == 429 and flood_waits < self._max_retries:
+                    # FloodWait: honour Telegram's requested pause instead of
+                    # burning a retry; retrying sooner only extends the ban.
+                    flood_waits += 1
+                    delay = self._retry_after_seconds(exc.response)
+                    logger.warning("Telegram rate limit hit; waiting %.1fs before retrying", delay)
+                    await asyncio.sleep(delay)
+                    continue
+                logger.warning("Telegram delivery failed on attempt %s: %s", attempt, exc)
+            except httpx.HTTPError as exc:  # pragma: no cover - exercised via tests with monkeypatch
+                last_error = exc
+                logger.warning("Telegram delivery failed on attempt %s: %s", attempt, exc)
+            if attempt < self._max_retries:
+                # Exponential backoff with jitter so concurrent sends do not
+                # hammer the API in lockstep after a shared failure.
+                await asyncio.sleep(min(30.0, float(2**attempt)) + random.random())
+            attempt += 1
+        logger.error("Telegram delivery failed after %s attempts: %s", self._max_retries, last_error)
+        return False
+
+    async def send_many(self, messages: Sequence[str]) -> List[bool]:
+        """Deliver a burst of messages concurrently, bounded by the API rate."""
+
+        if not messages:
+            return []
+        semaphore = asyncio.Semaphore(self._MAX_CONCURRENT_SENDS)
+
+        async def _bounded_send(message: str) -> bool:
+            async with semaphore:
+                return await self.send_async(message)
+
+        return list(await asyncio.gather(*(_bounded_send(message) for message in messages)))
+
+    def send(self, message: str) -> bool:
+        if not self._bot_token or not self._chat_id:
+            logger.debug("Telegram bot token or chat id not configured; skipping send")
+            return False
+
+        url, payload = self._send_url_payload(message)
         last_error: Optional[Exception] = None
         for attempt in range(1, self._max_retries + 1):
             try:
@@ -65,9 +180,58 @@ class TelegramBot:
         return False
 
 
+# Display strings are a closed set; precomputing them at import time removes
+# the replace/title/upper string churn from every format call.
+_SETUP_NAMES = {setup_type: setup_type.value.replace("_", " ").title() for setup_type in SignalSetupType}
+_DIRECTION_UPPER = {"long": "LONG", "short": "SHORT"}
+
+
+def _spec_rationale(spec: Tuple[Tuple[str, str, str], ...], fallback: str):
+    """Build a rationale renderer specialized to one setup type's field set."""
+
+    def build(metadata: dict) -> str:
+        parts = [
+            f"{label} {float(metadata[key]):{fmt}}"
+            for label, key, fmt in spec
+            if metadata.get(key) is not None
+        ]
+        return ", ".join(parts) if parts else fallback
+
+    return build
+
+
+# One pre-built renderer per setup type replaces the if/elif cascade and the
+# per-call field plumbing in _rationale.
+_RATIONALE_BUILDERS = {
+    SignalSetupType.SQUEEZE_REVERSAL: _spec_rationale(
+        (
+            ("compression", "compression_ratio", ".3f"),
+            ("momentum", "momentum", ".2f"),
+            ("funding", "funding_rate", ".4f"),
+            ("basis", "basis", ".4f"),
+        ),
+        "squeeze conditions met",
+    ),
+    SignalSetupType.ABSORPTION: _spec_rationale(
+        (
+            ("imbalance", "orderflow_imbalance", ".2f"),
+            ("delta", "delta_volume", ".2f"),
+            ("basis", "basis", ".4f"),
+        ),
+        "absorption pattern detected",
+    ),
+}
+
+
 class SignalAlertFormatter:
+    # Formatted messages are memoized per setup fingerprint; sticky setups
+    # recurring across snapshots (e.g. resends after a FloodWait) skip the
+    # level/rationale/f-string work entirely.
+    _FORMAT_CACHE_MAX = 256
+
     def __init__(self, base_url: Optional[str] = None) -> None:
-        self._base_url = base_url or "http://localhost:8080"
+        self._base_url = (base_url or "http://localhost:8080").rstrip("/")
+        self._format_cache: OrderedDict[tuple, str] = OrderedDict()
 
     def _infer_direction(self, signal: SignalEvent) -> str:
         setup = signal.setup
@@ -100,45 +264,44 @@ class SignalAlertFormatter:
         setup = signal.setup
         if setup is None:
             return "No setup metadata available"
-        m = setup.metadata or {}
-        if setup.type == SignalSetupType.SQUEEZE_REVERSAL:
-            cr = m.get("compression_ratio")
-            mom = m.get("momentum")
-            fr = m.get("funding_rate")
-            basis = m.get("basis")
-            parts = []
-            if cr is not None:
-                parts.append(f"compression {float(cr):.3f}")
-            if mom is not None:
-                parts.append(f"momentum {float(mom):.2f}")
-            if fr is not None:
-                parts.append(f"funding {float(fr):.4f}")
-            if basis is not None:
-                parts.append(f"basis {float(basis):.4f}")
-            return ", ".join(parts) if parts else "squeeze conditions met"
-        if setup.type == SignalSetupType.ABSORPTION:
-            imb = m.get("orderflow_imbalance")
-            dv = m.get("delta_volume")
-            basis = m.get("basis")
-            parts = []
-            if imb is not None:
-                parts.append(f"imbalance {float(imb):.2f}")
-            if dv is not None:
-                parts.append(f"delta {float(dv):.2f}")
-            if basis is not None:
-                parts.append(f"basis {float(basis):.4f}")
-            return ", ".join(parts) if parts else "absorption pattern detected"
-        return "setup detected"
+        builder = _RATIONALE_BUILDERS.get(setup.type)
+        if builder is None:
+            return "setup detected"
+        return builder(setup.metadata or {})
 
     def build_view_url(self, symbol: str) -> str:
-        return f"{self._base_url.rstrip('/')}/dashboard?symbol={symbol}"
+        return f"{self._base_url}/dashboard?symbol={symbol}"
+
+    @staticmethod
+    def _fingerprint(
+        signal: SignalEvent,
+        entry: Optional[float],
+        stop: Optional[float],
+        target: Optional[float],
+    ) -> tuple:
+        setup = signal.setup
+        return (
+            signal.symbol,
+            setup.type if setup is not None else None,
+            setup.confidence if setup is not None else None,
+            round(setup.score, 2) if setup is not None else None,
+            round(entry, 2) if entry is not None else None,
+            round(stop, 2) if stop is not None else None,
+            round(target, 2) if target is not None else None,
+        )
 
     def format(self, signal: SignalEvent) -> str:
+        entry, stop, target = self._levels(signal)
+        cache_key = self._fingerprint(signal, entry, stop, target)
+        cached = self._format_cache.get(cache_key)
+        if cached is not None:
+            self._format_cache.move_to_end(cache_key)
+            return cached
+
         setup = signal.setup
         confidence = setup.confidence.value if setup is not None else "n/a"
-        setup_name = setup.type.value.replace("_", " ").title() if setup is not None else "Unknown"
-        direction = self._infer_direction(signal).upper()
-        entry, stop, target = self._levels(signal)
+        setup_name = _SETUP_NAMES[setup.type] if setup is not None else "Unknown"
+        direction = _DIRECTION_UPPER[self._infer_direction(signal)]
         entry_str = f"{entry:.2f}" if entry is not None else "n/a"
         stop_str = f"{stop:.2f}" if stop is not None else "n/a"
         target_str = f"{target:.2f}" if target is not None else "n/a"
@@ -153,16 +316,33 @@ class SignalAlertFormatter:
             f"Rationale: {rationale}",
             f"View: {url}",
         ]
-        return "\n".join(lines)
+        message = "\n".join(lines)
+        self._format_cache[cache_key] = message
+        if len(self._format_cache) > self._FORMAT_CACHE_MAX:
+            self._format_cache.popitem(last=False)
+        return message
 
 
 class SignalAlertPipeline:
     """Processes snapshots and emits Telegram alerts for newly generated signals.
 
     New signals are detected using their generation timestamp. Confidence filters
-    control which signals are eligible for alerting.
+    control which signals are eligible for alerting. Delivered signal ids are
+    remembered in a bounded LRU so the pipeline's memory stays flat no matter
+    how long the process runs.
     """
 
+    # Dedupe window: signals older than this are already excluded by the
+    # generation-timestamp check, so their ids can be evicted safely.
+    _SENT_IDS_MAX = 4096
+    _SENT_IDS_TTL = timedelta(hours=24)
+
+    # Telegram caps messages at 4096 chars; packing several alerts into one
+    # message spends one rate-limit slot instead of one per signal. The limit
+    # leaves headroom for the divider and any trailing formatting.
+    _PACK_CHAR_LIMIT = 4000
+    _PACK_SEPARATOR = "\n\n---\n\n"
+
     def __init__(self, settings: Settings, config: Optional[SignalAlertConfig] = None) -> None:
         cfg = config or SignalAlertConfig(
             enabled=settings.signal_alerts_enabled,
@@ -180,16 +360,20 @@ class SignalAlertPipeline:
         )
         self._formatter = SignalAlertFormatter(base_url=cfg.web_base_url)
         self._last_seen_at: Optional[datetime] = None
-        self._sent_signal_ids: set[int] = set()
+        # Insertion-ordered id -> generated_at map acting as an LRU: oldest
+        # entries fall off the front once the cap or TTL is exceeded.
+        self._sent_signal_ids: OrderedDict[int, datetime] = OrderedDict()
+        # Generation timestamps keyed on the signal list identity: the
+        # repository reuses the same snapshot until the file changes, so the
+        # keys (and whether they are sorted) are computed once per snapshot.
+        self._signal_keys: Optional[Tuple[object, List[datetime], bool]] = None
 
     def _is_new(self, signal: SignalEvent) -> bool:
         if self._last_seen_at is None:
             return True
-        # Ensure timezone-aware comparison
-        sig_time = signal.generated_at
-        if sig_time.tzinfo is None:
-            sig_time = sig_time.replace(tzinfo=timezone.utc)
-        return sig_time > self._last_seen_at
+        # generated_at is UTC-normalized at model construction, so the
+        # comparison needs no per-call tzinfo check or replace() allocation.
+        return signal.generated_at > self._last_seen_at
 
     def _eligible(self, signal: SignalEvent) -> bool:
         if signal.setup is None:
@@ -200,38 +384,127 @@ class SignalAlertPipeline:
             return True
         return False
 
-    def process(self, snapshot: MetricsSnapshot) -> List[int]:
-        if not self._config.enabled:
-            logger.debug("Signal alert pipeline disabled; skipping processing")
-            return []
-
+    def _generated_keys(self, signals: List[SignalEvent]) -> Tuple[List[datetime], bool]:
+        cached = self._signal_keys
+        if cached is not None and cached[0] is signals:
+            return cached[1], cached[2]
+        keys = [signal.generated_at for signal in signals]
+        is_sorted = all(earlier <= later for earlier, later in zip(keys, keys[1:]))
+        self._signal_keys = (signals, keys, is_sorted)
+        return keys, is_sorted
+
+    def _select_eligible(self, snapshot: MetricsSnapshot) -> List[SignalEvent]:
+        signals = snapshot.signals
+        # Producers emit chronologically, so when the snapshot is sorted a
+        # binary search skips the already-processed prefix outright instead
+        # of running the predicates over every historical signal.
+        if signals and self._last_seen_at is not None:
+            keys, is_sorted = self._generated_keys(signals)
+            if is_sorted:
+                start = bisect_right(keys, self._last_seen_at)
+                if start:
+                    signals = signals[start:]
+        # Cheapest predicate first: the O(1) sent-ids probe rejects the bulk
+        # of steady-state signals before the datetime work in _is_new runs.
+        sent_ids = self._sent_signal_ids
         eligible: List[SignalEvent] = [
-            s for s in snapshot.signals if self._eligible(s) and self._is_new(s) and s.id not in self._sent_signal_ids
+            s for s in signals if s.id not in sent_ids and self._eligible(s) and self._is_new(s)
         ]
         eligible.sort(key=lambda s: s.generated_at)
-
+        return eligible
+
+    def _remember_sent(self, signal: SignalEvent) -> None:
+        sent_ids = self._sent_signal_ids
+        sent_ids[signal.id] = signal.generated_at
+        sent_ids.move_to_end(signal.id)
+        cutoff = signal.generated_at - self._SENT_IDS_TTL
+        while sent_ids and (
+            len(sent_ids) > self._SENT_IDS_MAX or next(iter(sent_ids.values())) < cutoff
+        ):
+            sent_ids.popitem(last=False)
+
+    @classmethod
+    def _pack_messages(cls, messages: Sequence[str]) -> List[Tuple[str, List[int]]]:
+        """Greedily pack formatted alerts into length-capped Telegram messages.
+
+        Returns ``(packed_text, member_indices)`` pairs; delivery of a pack
+        counts for every member (all-or-nothing).
+        """
+
+        packs: List[Tuple[str, List[int]]] = []
+        current: List[int] = []
+        length = 0
+        for index, message in enumerate(messages):
+            extra = len(message) + (len(cls._PACK_SEPARATOR) if current else 0)
+            if current and length + extra > cls._PACK_CHAR_LIMIT:
+                packs.append((cls._PACK_SEPARATOR.join(messages[i] for i in current), current))
+                current = []
+                length = 0
+                extra = len(message)
+            current.append(index)
+            length += extra
+        if current:
+            packs.append((cls._PACK_SEPARATOR.join(messages[i] for i in current), current))
+        return packs
+
+    def _record_outcomes(
+        self, eligible: Sequence[SignalEvent], outcomes: Sequence[bool]
+    ) -> List[int]:
         delivered_ids: List[int] = []
-        for signal in eligible:
-            message = self._formatter.format(signal)
-            try:
-                delivered = self._bot.send(message)
-            except Exception as exc:  # pragma: no cover - defensive guard
-                delivered = False
-                logger.debug("Unexpected error when sending Telegram alert", exc_info=True)
-                logger.warning("Failed to deliver Telegram alert for signal %s: %s", signal.id, exc)
-
+        for signal, delivered in zip(eligible, outcomes):
             if delivered:
                 delivered_ids.append(signal.id)
-                self._sent_signal_ids.add(signal.id)
+                self._remember_sent(signal)
                 if self._last_seen_at is None or signal.generated_at > self._last_seen_at:
                     self._last_seen_at = signal.generated_at
             else:
                 logger.warning("Telegram delivery reported failure for signal %s", signal.id)
 
-        if eligible:
-            latest_time = max(s.generated_at for s in eligible)
-            if self._last_seen_at is None or latest_time > self._last_seen_at:
-                self._last_seen_at = latest_time
+        # _last_seen_at only advances past delivered signals (the loop above
+        # keeps the running maximum); advancing it past failed ones would
+        # silently drop them from the next retry.
 
         logger.info("Signal alert pipeline processed %s eligible, %s delivered", len(eligible), len(delivered_ids))
         return delivered_ids
+
+    def process(self, snapshot: MetricsSnapshot) -> List[int]:
+        if not self._config.enabled:
+            logger.debug("Signal alert pipeline disabled; skipping processing")
+            return []
+
+        eligible = self._select_eligible(snapshot)
+        messages = [self._formatter.format(signal) for signal in eligible]
+        outcomes: List[bool] = [False] * len(eligible)
+        for packed, members in self._pack_messages(messages):
+            try:
+                delivered = self._bot.send(packed)
+            except Exception as exc:  # pragma: no cover - defensive guard
+                delivered = False
+                logger.debug("Unexpected error when sending Telegram alert", exc_info=True)
+                logger.warning("Failed to deliver packed Telegram alert: %s", exc)
+            for index in members:
+                outcomes[index] = delivered
+
+        return self._record_outcomes(eligible, outcomes)
+
+    async def process_async(self, snapshot: MetricsSnapshot) -> List[int]:
+        """Async variant of :meth:`process` that overlaps the Telegram sends."""
+
+        if not self._config.enabled:
+            logger.debug("Signal alert pipeline disabled; skipping processing")
+            return []
+
+        eligible = self._select_eligible(snapshot)
+        messages = [self._formatter.format(signal) for signal in eligible]
+        packs = self._pack_messages(messages)
+        outcomes: List[bool] = [False] * len(eligible)
+        try:
+            pack_outcomes = await self._bot.send_many([packed for packed, _ in packs])
+        except Exception:  # pragma: no cover - defensive guard
+            logger.debug("Unexpected error when sending Telegram alerts", exc_info=True)
+            pack_outcomes = [False] * len(packs)
+        for (_, members), delivered in zip(packs, pack_outcomes):
+            for index in members:
+                outcomes[index] = delivered
+
+        return self._record_outcomes(eligible, outcomes)
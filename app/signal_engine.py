@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from math import floor
-from typing import Dict, Iterable, List, Literal, Optional, Tuple
+from typing import Dict, Iterable, List, Literal, Optional, Sequence, Tuple, Union
+
+import numpy as np
 
 from .models import (
     SignalConfidence,
@@ -13,7 +14,7 @@ from .models import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     """Lightweight representation of a trade used for volume aggregation."""
 
@@ -30,7 +31,36 @@ class Trade:
             raise ValueError("Trade side must be 'buy' or 'sell'")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class TradeBatch:
+    """Column-oriented trade batch for vectorized volume aggregation.
+
+    Holding the trade columns as NumPy arrays lets the volume profile build
+    run as a handful of C-level array ops instead of a Python loop over
+    ``Trade`` objects.
+    """
+
+    prices: np.ndarray
+    quantities: np.ndarray
+    buy_mask: np.ndarray
+
+    @classmethod
+    def from_trades(cls, trades: Sequence[Trade]) -> "TradeBatch":
+        count = len(trades)
+        prices = np.fromiter((trade.price for trade in trades), dtype=np.float64, count=count)
+        quantities = np.fromiter(
+            (trade.quantity for trade in trades), dtype=np.float64, count=count
+        )
+        buy_mask = np.fromiter(
+            (trade.side == "buy" for trade in trades), dtype=np.bool_, count=count
+        )
+        return cls(prices=prices, quantities=quantities, buy_mask=buy_mask)
+
+    def __len__(self) -> int:
+        return int(self.prices.shape[0])
+
+
+@dataclass(frozen=True, slots=True)
 class SignalEngineConfig:
     """Configuration tuning thresholds for setup detection and profiling."""
 
@@ -65,87 +95,158 @@ class SignalEngine:
     ) -> Optional[SignalSetup]:
         """Evaluate the dominant setup produced by the current market state."""
 
-        volume_profile = self._build_volume_profile(trades)
         basis = self._basis(spot_price, perp_price)
 
-        candidates: List[SignalSetup] = []
+        # The scalar prerequisite checks run first so the volume profile —
+        # the expensive step — is only built when at least one setup can
+        # actually fire.
+        squeeze_possible = self._squeeze_prereqs(indicators, basis)
+        absorption_possible = self._absorption_prereqs(indicators, basis)
+        if not squeeze_possible and not absorption_possible:
+            return None
 
-        squeeze = self._evaluate_squeeze_reversal(
-            indicators=indicators,
-            funding_rate=funding_rate,
-            basis=basis,
-            volume_profile=volume_profile,
-        )
-        if squeeze is not None:
-            candidates.append(squeeze)
+        volume_profile = self._build_volume_profile(trades)
 
-        absorption = self._evaluate_absorption(
-            indicators=indicators,
-            basis=basis,
-            volume_profile=volume_profile,
-        )
-        if absorption is not None:
-            candidates.append(absorption)
+        candidates: List[SignalSetup] = []
 
-        if not candidates:
-            return None
+        if squeeze_possible:
+            candidates.append(
+                self._evaluate_squeeze_reversal(
+                    indicators=indicators,
+                    funding_rate=funding_rate,
+                    basis=basis,
+                    volume_profile=volume_profile,
+                )
+            )
+
+        if absorption_possible:
+            candidates.append(
+                self._evaluate_absorption(
+                    indicators=indicators,
+                    basis=basis,
+                    volume_profile=volume_profile,
+                )
+            )
 
         return max(candidates, key=lambda setup: setup.score)
 
-    def build_volume_profile(self, trades: Iterable[Trade]) -> VolumeProfile:
+    def _squeeze_prereqs(self, indicators: Dict[str, float], basis: float) -> bool:
+        bb_width = indicators.get("bb_width")
+        kc_width = indicators.get("kc_width")
+        if bb_width is None or kc_width is None or kc_width <= 0:
+            return False
+        if bb_width > self._config.squeeze_bb_width_max:
+            return False
+        if bb_width / kc_width > self._config.squeeze_volatility_ratio_max:
+            return False
+        return basis >= self._config.squeeze_basis_min
+
+    def _absorption_prereqs(self, indicators: Dict[str, float], basis: float) -> bool:
+        imbalance = indicators.get("orderflow_imbalance")
+        delta_volume = indicators.get("delta_volume")
+        if imbalance is None or delta_volume is None:
+            return False
+        if imbalance < self._config.absorption_imbalance_threshold:
+            return False
+        if delta_volume < self._config.absorption_delta_volume_threshold:
+            return False
+        return abs(basis) <= self._config.absorption_basis_tolerance
+
+    def build_volume_profile(self, trades: Union[TradeBatch, Iterable[Trade]]) -> VolumeProfile:
         """Expose volume profile calculation for external callers/tests."""
 
         return self._build_volume_profile(trades)
 
-    def _build_volume_profile(self, trades: Iterable[Trade]) -> VolumeProfile:
-        trade_list = list(trades)
-        if not trade_list:
+    def _build_volume_profile(self, trades: Union[TradeBatch, Iterable[Trade]]) -> VolumeProfile:
+        if isinstance(trades, TradeBatch):
+            batch = trades
+        else:
+            trade_list = trades if isinstance(trades, (list, tuple)) else list(trades)
+            batch = TradeBatch.from_trades(trade_list)
+        if not len(batch):
             return VolumeProfile(bins=[], value_area=None)
 
         bin_size = self._config.volume_profile_bin_size
         if bin_size <= 0:
             raise ValueError("volume_profile_bin_size must be positive")
 
-        buckets: Dict[float, Dict[str, float]] = {}
-        for trade in trade_list:
-            bucket_price = floor(trade.price / bin_size) * bin_size
-            bucket = buckets.setdefault(bucket_price, {"buy": 0.0, "sell": 0.0})
-            bucket[trade.side] += trade.quantity
+        # One vectorized pass: bucket every trade, then bincount the buy and
+        # sell quantities into per-bucket totals. Shifting by the smallest
+        # bucket id keeps the bincount arrays no wider than the price range.
+        bucket_ids = np.floor_divide(batch.prices, bin_size).astype(np.int64)
+        offset = int(bucket_ids.min())
+        local_ids = bucket_ids - offset
+        buy_volumes = np.bincount(
+            local_ids, weights=np.where(batch.buy_mask, batch.quantities, 0.0)
+        )
+        sell_volumes = np.bincount(
+            local_ids, weights=np.where(batch.buy_mask, 0.0, batch.quantities)
+        )
+        total_volumes = buy_volumes + sell_volumes
+        occupied = np.nonzero(total_volumes)[0]
+        occupied_volumes = total_volumes[occupied]
+        profile_total = float(occupied_volumes.sum())
 
         bins = [
             VolumeProfileBin(
-                price=price,
-                buy_volume=data["buy"],
-                sell_volume=data["sell"],
-                total_volume=data["buy"] + data["sell"],
+                price=(offset + index) * bin_size,
+                buy_volume=float(buy_volumes[index]),
+                sell_volume=float(sell_volumes[index]),
+                total_volume=float(total_volumes[index]),
             )
-            for price, data in sorted(buckets.items())
+            for index in occupied
         ]
 
-        value_area = self._value_area_range(bins)
-        return VolumeProfile(bins=bins, value_area=value_area)
+        value_area = self._value_area_range(
+            bins, volumes=occupied_volumes, total_volume=profile_total
+        )
+        return VolumeProfile(bins=bins, value_area=value_area, total_volume=profile_total)
 
-    def _value_area_range(self, bins: List[VolumeProfileBin]) -> Optional[Tuple[float, float]]:
+    def _value_area_range(
+        self,
+        bins: List[VolumeProfileBin],
+        volumes: Optional[np.ndarray] = None,
+        total_volume: Optional[float] = None,
+    ) -> Optional[Tuple[float, float]]:
         if not bins:
             return None
 
-        total_volume = sum(bin.total_volume for bin in bins)
+        count = len(bins)
+        # The profile build already holds the volume column and its sum;
+        # reuse them instead of walking the bins list again.
+        if volumes is None:
+            volumes = np.fromiter(
+                (item.total_volume for item in bins), dtype=np.float64, count=count
+            )
+        if total_volume is None:
+            total_volume = float(volumes.sum())
         if total_volume <= 0:
             return None
 
         target = total_volume * self._config.value_area_volume_fraction
-        cumulative = 0.0
-        selected: List[float] = []
-        for item in sorted(bins, key=lambda candidate: candidate.total_volume, reverse=True):
-            cumulative += item.total_volume
-            selected.append(item.price)
-            if cumulative >= target:
+        # The value area only ever needs the top-k buckets covering the target
+        # fraction, typically a small k. argpartition selects those in O(N)
+        # and k doubles on the rare profile whose volume is spread thin,
+        # avoiding the O(N log N) full sort on wide profiles.
+        k = min(8, count)
+        while True:
+            if k >= count:
+                top = np.argsort(-volumes, kind="stable")
+            else:
+                top = np.argpartition(-volumes, k - 1)[:k]
+                top = top[np.argsort(-volumes[top], kind="stable")]
+            cumulative = np.cumsum(volumes[top])
+            hit = int(np.searchsorted(cumulative, target))
+            if hit < top.shape[0]:
+                selected = top[: hit + 1]
                 break
+            if k >= count:
+                selected = top
+                break
+            k *= 2
 
-        if not selected:
-            return None
-
-        return (min(selected), max(selected))
+        prices = [bins[index].price for index in selected]
+        return (min(prices), max(prices))
 
     def _evaluate_squeeze_reversal(
         self,
@@ -154,19 +255,11 @@ class SignalEngine:
         funding_rate: float,
         basis: float,
         volume_profile: VolumeProfile,
-    ) -> Optional[SignalSetup]:
-        bb_width = indicators.get("bb_width")
-        kc_width = indicators.get("kc_width")
-        if bb_width is None or kc_width is None or kc_width <= 0:
-            return None
-
+    ) -> SignalSetup:
+        # Caller has already validated the prerequisites via _squeeze_prereqs.
+        bb_width = indicators["bb_width"]
+        kc_width = indicators["kc_width"]
         compression_ratio = bb_width / kc_width
-        if bb_width > self._config.squeeze_bb_width_max:
-            return None
-        if compression_ratio > self._config.squeeze_volatility_ratio_max:
-            return None
-        if basis < self._config.squeeze_basis_min:
-            return None
 
         momentum = indicators.get("momentum", 0.0)
         momentum_shift = indicators.get("momentum_shift", 0.0)
@@ -208,18 +301,10 @@ class SignalEngine:
         indicators: Dict[str, float],
         basis: float,
         volume_profile: VolumeProfile,
-    ) -> Optional[SignalSetup]:
-        imbalance = indicators.get("orderflow_imbalance")
-        delta_volume = indicators.get("delta_volume")
-        if imbalance is None or delta_volume is None:
-            return None
-
-        if imbalance < self._config.absorption_imbalance_threshold:
-            return None
-        if delta_volume < self._config.absorption_delta_volume_threshold:
-            return None
-        if abs(basis) > self._config.absorption_basis_tolerance:
-            return None
+    ) -> SignalSetup:
+        # Caller has already validated the prerequisites via _absorption_prereqs.
+        imbalance = indicators["orderflow_imbalance"]
+        delta_volume = indicators["delta_volume"]
 
         liquidation_cluster = indicators.get("liquidation_cluster", 0.0)
 
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Sequence, Tuple
 
-from .market_models import MarketDataset, MarketInstrument, PricePoint, SeriesPoint, VolumeLevels
+from .market_models import MarketDataset, MarketInstrument, VolumeLevels
 from .models import SignalConfidence, SignalEvent, SignalSetup, SignalSetupType, VolumeProfile
 from .sessions import determine_session
 from .signal_scoring import SignalContext, SignalScoringEngine, SignalScoringResult
@@ -12,7 +12,7 @@ from .signal_storage import InMemorySignalStorage, SignalRecord, SignalStorage
 
 
 def _ema(values: Sequence[float], period: int) -> Optional[float]:
-    if not values:
+    if len(values) == 0:
         return None
     period = max(period, 1)
     seed = min(len(values), period)
@@ -46,19 +46,6 @@ def _adx(values: Sequence[float], period: int = 14) -> Optional[float]:
     return max(0.0, min(adx, 100.0))
 
 
-def _vwap(price_points: Sequence[PricePoint]) -> Optional[float]:
-    if not price_points:
-        return None
-    total_price = sum(point.close for point in price_points)
-    return total_price / len(price_points)
-
-
-def _series_slope(series: Sequence[SeriesPoint]) -> Optional[float]:
-    if len(series) < 2:
-        return None
-    return series[-1].value - series[-2].value
-
-
 def _value_area(levels: Optional[VolumeLevels]) -> Optional[Tuple[float, float]]:
     if levels is None:
         return None
@@ -120,21 +107,26 @@ class SignalScoringWorker:
     def build_context(self, instrument: MarketInstrument) -> Optional[SignalContext]:
         if not instrument.price:
             return None
-        price_points = sorted(instrument.price, key=lambda point: point.time)
-        price_values = [point.close for point in price_points]
+        # The cached instrument columns carry the sorted numeric data, so
+        # the per-point model iteration happens once per instrument instead
+        # of once per scoring run.
+        price_points = instrument.sorted_price
+        price_values = instrument.price_closes
         timestamp = price_points[-1].time
         if timestamp.tzinfo is None:
             timestamp = timestamp.replace(tzinfo=timezone.utc)
 
-        delta_series = sorted(instrument.delta_oi_pct, key=lambda point: point.time) if instrument.delta_oi_pct else []
-        cvd_series = sorted(instrument.cvd, key=lambda point: point.time) if instrument.cvd else []
+        delta_values = instrument.delta_oi_values
+        cvd_values = instrument.cvd_values
 
         ema50 = _ema(price_values, 50)
         adx14 = _adx(price_values, 14)
-        vwap = _vwap(price_points)
-        delta_oi = delta_series[-1].value if delta_series else None
-        cvd_value = cvd_series[-1].value if cvd_series else None
-        cvd_slope = _series_slope(cvd_series)
+        vwap = float(price_values.mean()) if price_values.size else None
+        delta_oi = float(delta_values[-1]) if delta_values.size else None
+        cvd_value = float(cvd_values[-1]) if cvd_values.size else None
+        cvd_slope = (
+            float(cvd_values[-1] - cvd_values[-2]) if cvd_values.size >= 2 else None
+        )
         session = determine_session(timestamp)
         value_area = _value_area(instrument.volume_levels)
         lvns = (
@@ -13,6 +13,74 @@
   const signalTableBody = document.querySelector("[data-signal-feed-body]");
   const filtersForm = document.getElementById("signal-feed-filters");
 
+  function setMetricText(name, text) {
+    const el = document.querySelector(`[data-metric="${name}"]`);
+    if (el) {
+      el.textContent = text;
+    }
+  }
+
+  function formatFixed(value, fractionDigits, suffix = "") {
+    if (value === null || value === undefined || Number.isNaN(Number(value))) {
+      return "n/a";
+    }
+    return Number(value).toFixed(fractionDigits) + suffix;
+  }
+
+  function renderStatusCard(section, status) {
+    const card = document.querySelector(`[data-status-card="${section}"]`);
+    const chip = document.querySelector(`[data-status-chip="${section}"]`);
+    if (card && status) {
+      card.classList.add(`status-${status}`);
+    }
+    if (chip && status) {
+      chip.textContent = status.toUpperCase();
+    }
+  }
+
+  function renderMetricsIsland() {
+    const island = document.getElementById("dashboard-metrics");
+    if (!island) {
+      return;
+    }
+
+    let metrics;
+    try {
+      metrics = JSON.parse(island.textContent || "{}");
+    } catch (error) {
+      console.error("Failed to parse dashboard metrics island", error);
+      return;
+    }
+    if (!metrics?.ingestion || !metrics?.signals || !metrics?.performance) {
+      return;
+    }
+
+    const generatedEl = document.querySelector("[data-metrics-generated-at]");
+    if (generatedEl && metrics.generated_at) {
+      generatedEl.textContent = `Snapshot generated at ${metrics.generated_at}`;
+    }
+
+    renderStatusCard("ingestion", metrics.ingestion.status);
+    setMetricText("ingestion-latest-source", metrics.ingestion.latest_source || "n/a");
+    setMetricText("ingestion-latency", formatFixed(metrics.ingestion.current_latency_seconds, 1, " s"));
+    setMetricText("ingestion-gap", formatFixed(metrics.ingestion.time_since_last_event_seconds, 0, " s"));
+    setMetricText("ingestion-max-latency", formatFixed(metrics.ingestion.max_latency_seconds, 1, " s"));
+
+    renderStatusCard("signals", metrics.signals.status);
+    setMetricText("signals-total", String(metrics.signals.total));
+    setMetricText("signals-last-60", String(metrics.signals.last_60_minutes));
+    setMetricText("signals-cadence", formatFixed(metrics.signals.cadence_seconds_avg, 0, " s"));
+    setMetricText("signals-average-score", formatFixed(metrics.signals.average_score, 2));
+
+    renderStatusCard("performance", metrics.performance.status);
+    setMetricText("performance-wins", String(metrics.performance.wins));
+    setMetricText("performance-losses", String(metrics.performance.losses));
+    setMetricText("performance-win-rate", formatFixed(metrics.performance.win_rate * 100, 1, "%"));
+    setMetricText("performance-avg-return", formatFixed(metrics.performance.avg_return_pct * 100, 2, "%"));
+  }
+
+  renderMetricsIsland();
+
   if (!chartContainers.length || !signalTableBody || !filtersForm) {
     return;
   }